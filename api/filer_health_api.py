@@ -66,42 +66,21 @@ class FilerHealthAPIClient(BaseAPIClient):
                 "error": "No filer health data found or API error"
             }
         
+        rollup = FilerHealth.fleet_rollup(health_records)
+        
         # Overall health statistics
-        healthy_filers = sum(1 for h in health_records if h.is_healthy)
-        unhealthy_filers = sum(1 for h in health_records if h.is_unhealthy)
-        warning_filers = sum(1 for h in health_records if h.has_warnings)
+        healthy_filers = rollup["overall"]["Healthy"]
+        unhealthy_filers = rollup["overall"]["Unhealthy"]
+        warning_filers = rollup["overall"]["Warning"]
         
         # Component-specific statistics
-        component_stats = {}
-        all_components = [
-            "network", "memory", "cpu", "disk", "filesystem", "services",
-            "nfs", "smb", "directoryservices", "cyberresilience", 
-            "fileaccelerator", "agfl", "nasuni_iq"
-        ]
-        
-        for component in all_components:
-            healthy_count = 0
-            unhealthy_count = 0
-            no_results_count = 0
-            
-            for health in health_records:
-                status = getattr(health, component, "")
-                if status == "Healthy":
-                    healthy_count += 1
-                elif status == "Unhealthy":
-                    unhealthy_count += 1
-                elif status == "No Results":
-                    no_results_count += 1
-            
-            component_stats[component] = {
-                "healthy": healthy_count,
-                "unhealthy": unhealthy_count,
-                "no_results": no_results_count,
-                "monitored": healthy_count + unhealthy_count
-            }
+        component_stats = {
+            component: dict(counts, monitored=counts["healthy"] + counts["unhealthy"])
+            for component, counts in rollup["components"].items()
+        }
         
         # Calculate average health score
-        health_scores = [h.health_score for h in health_records if h.health_score > 0]
+        health_scores = rollup["scores"]
         avg_health_score = round(sum(health_scores) / len(health_scores), 1) if health_scores else 0
         
         # Find most problematic components
@@ -142,13 +121,7 @@ class FilerHealthAPIClient(BaseAPIClient):
         """Get filers filtered by specific component health status."""
         health_records = await self.get_filer_health_as_models()
         
-        valid_components = [
-            "network", "memory", "cpu", "disk", "filesystem", "services",
-            "nfs", "smb", "directoryservices", "cyberresilience", 
-            "fileaccelerator", "agfl", "nasuni_iq"
-        ]
-        
-        if component not in valid_components:
+        if component not in FilerHealth.COMPONENT_FIELDS:
             return []
         
         return [
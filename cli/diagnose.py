@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""System diagnosis command (`python main.py diagnose`)."""
+
+import asyncio
+import sys
+from api.filers_api import FilersAPIClient
+from api.volumes_api import VolumesAPIClient
+from api.cloud_credentials_api import CloudCredentialsAPIClient
+from server.mcp_server import MCPServer
+from config.settings import config
+
+
+# (label, client class, statistics method, data label, stats -> report lines)
+API_CHECKS = (
+    ("Filers", FilersAPIClient, "get_filer_statistics", "Filers Data",
+     lambda stats: [f"Filers Found: {stats.get('total', 0)}"]),
+    ("Volumes", VolumesAPIClient, "get_volume_statistics", "Volumes Data",
+     lambda stats: [f"Volumes Found: {stats.get('total', 0)}"]),
+    ("Cloud Credentials", CloudCredentialsAPIClient, "get_credential_statistics", "Credentials Data",
+     lambda stats: [
+         f"Credentials Found: {stats.get('total_deployments', 0)} deployments",
+         f"Unique Credentials: {stats.get('unique_credentials', 0)}",
+         f"In Use: {stats.get('in_use', 0)}",
+     ]),
+)
+
+
+async def _check_api(label, client_cls, stats_method, data_label, report):
+    """Test one API and return its report lines."""
+    try:
+        client = client_cls(config.filers_config)
+        if not await client.test_connection():
+            return [f"{label} API: ❌ Connection failed"]
+        lines = [f"{label} API: ✅ Connected"]
+        try:
+            lines.extend(report(await getattr(client, stats_method)()))
+        except Exception as e:
+            lines.append(f"{data_label}: ❌ {e}")
+        return lines
+    except Exception as e:
+        return [f"{label} API: ❌ {e}"]
+
+
+async def diagnose_system():
+    """Comprehensive system diagnosis."""
+    print("🔍 SYSTEM DIAGNOSIS", file=sys.stderr)
+    print("=" * 50, file=sys.stderr)
+    
+    # 1. Configuration check
+    print("📋 Configuration Check:", file=sys.stderr)
+    try:
+        print(f"   Filers API URL: {config.filers_config.base_url}", file=sys.stderr)
+        print(f"   API Token: {'✅ Present' if config.filers_config.token else '❌ Missing'}", file=sys.stderr)
+        print(f"   SSL Verification: {config.filers_config.verify_ssl}", file=sys.stderr)
+        print(f"   Timeout: {config.filers_config.timeout}s", file=sys.stderr)
+        
+        # Check if shares and volumes configs exist
+        for service in ("shares", "volumes"):
+            state = "✅ Available" if service in config.available_services else "❌ Missing"
+            print(f"   {service.capitalize()} Config: {state}", file=sys.stderr)
+            
+    except Exception as e:
+        print(f"   ❌ Configuration error: {e}", file=sys.stderr)
+    
+    # 2. API connectivity test
+    print("\n🌐 API Connectivity:", file=sys.stderr)
+    
+    # The APIs are independent, so probe them concurrently and report in order
+    results = await asyncio.gather(*(_check_api(*check) for check in API_CHECKS))
+    for lines in results:
+        for line in lines:
+            print(f"   {line}", file=sys.stderr)
+    
+    # 3. Tool registration test
+    print("\n🛠️  Tool Registration:", file=sys.stderr)
+    try:
+        mcp_server = MCPServer("nmc-diagnosis-server")
+        tools = mcp_server.tool_registry.get_tool_names()
+        print(f"   Total Tools: {len(tools)}", file=sys.stderr)
+        for tool in tools:
+            print(f"   - {tool}", file=sys.stderr)
+    except Exception as e:
+        print(f"   ❌ Tool registration error: {e}", file=sys.stderr)
+    
+    print("\n" + "=" * 50, file=sys.stderr)
+    print("🏁 Diagnosis Complete", file=sys.stderr)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Shares API quick test command (`python main.py test-api`)."""
+
+import importlib
+import sys
+from config.settings import config
+
+
+async def quick_share_test():
+    """Quick test of shares functionality."""
+    print("Quick Share Test\n", file=sys.stderr)
+    
+    try:
+        # Test 1: Can we import the shares API?
+        print("1. Testing shares API import...", file=sys.stderr)
+        from api.shares_api import SharesAPIClient
+        print("   ✅ SharesAPIClient imported", file=sys.stderr)
+        
+        # Test 2: Can we connect to the API?
+        print("\n2. Testing API connection...", file=sys.stderr)
+        client = SharesAPIClient(config.filers_config)
+        response = await client.list_shares()
+        
+        if "error" in response:
+            print(f"   ❌ API Error: {response['error']}", file=sys.stderr)
+            return
+        
+        items = response.get("items", [])
+        print(f"   ✅ Connected! Found {len(items)} shares", file=sys.stderr)
+        
+        # Test 3: Show sample share data
+        if items:
+            print("\n3. Sample share data:", file=sys.stderr)
+            first = items[0]
+            print(f"   Name: {first.get('share_name')}", file=sys.stderr)
+            print(f"   Path: {first.get('path')}", file=sys.stderr)
+            print(f"   Filer: {first.get('filer_serial_number')[:8]}...", file=sys.stderr)
+            print(f"   Previous Versions: {first.get('enable_previous_vers', 'N/A')}", file=sys.stderr)
+            print(f"   Fruit Enabled: {first.get('fruit_enabled', 'N/A')}", file=sys.stderr)
+        
+        # Test 4: Try to import share tools one by one
+        print("\n4. Testing tool imports:", file=sys.stderr)
+        
+        tools_to_test = [
+            "ListSharesTool",
+            "GetShareStatsTool", 
+            "GetSharesByFilerTool",
+            "GetBrowserAccessibleSharesTool",
+            "GetSharesByVolumeTool"
+        ]
+        
+        # Import the module once, then look each tool up on it
+        try:
+            share_tools = importlib.import_module("tools.share_tools")
+            module_error = None
+        except ImportError as e:
+            share_tools, module_error = None, e
+        
+        working_tools = []
+        for tool_name in tools_to_test:
+            if share_tools is not None and hasattr(share_tools, tool_name):
+                print(f"   ✅ {tool_name}", file=sys.stderr)
+                working_tools.append(tool_name)
+            else:
+                error = module_error or f"cannot import name '{tool_name}' from 'tools.share_tools'"
+                print(f"   ❌ {tool_name}: {error}", file=sys.stderr)
+        
+        print(f"\n✅ Summary: {len(working_tools)}/{len(tools_to_test)} tools working", file=sys.stderr)
+        print(f"   Working tools: {', '.join(working_tools)}", file=sys.stderr)
+        
+    except ImportError as e:
+        print(f"❌ Import failed: {e}", file=sys.stderr)
+    except Exception as e:
+        print(f"❌ Test failed: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc(file=sys.stderr)
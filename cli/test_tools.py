@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Tool smoke-test command (`python main.py test-tools`)."""
+
+import asyncio
+import sys
+from server.mcp_server import MCPServer
+
+
+# Upper bound on tool calls in flight against the NMC at once
+MAX_CONCURRENT_TOOLS = 8
+
+# Tools that can rotate the API token; run one at a time before the concurrent
+# batch so no data call is in flight while the token changes
+TOKEN_TOOLS = ("refresh_auth_token", "ensure_valid_auth_token")
+
+
+async def _run_tool(registry, tool_name, semaphore):
+    """Execute one tool with empty arguments; return (status, result line)."""
+    try:
+        async with semaphore:
+            # Test with minimal/empty arguments
+            result = await registry.execute_tool(tool_name, {})
+        
+        if result and len(result) > 0:
+            text_length = len(result[0].text) if hasattr(result[0], 'text') else 0
+            if "❌ Error:" in result[0].text:
+                return "❌ Error", "❌ Error in response"
+            return "✅ Success", f"✅ Success ({text_length} chars)"
+        return "⚠️ Empty", "⚠️ Empty response"
+    except Exception as e:
+        return f"❌ {str(e)}", f"❌ Exception: {e}"
+
+
+async def test_all_tools():
+    """Test all registered tools."""
+    print("🧪 TESTING ALL TOOLS", file=sys.stderr)
+    print("=" * 50, file=sys.stderr)
+    
+    try:
+        mcp_server = MCPServer("nmc-test-server")
+        tools = mcp_server.tool_registry.get_tool_names()
+        
+        print(f"📋 Testing {len(tools)} tools...", file=sys.stderr)
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOLS)
+        outcomes = {}
+        for tool_name in tools:
+            if tool_name in TOKEN_TOOLS:
+                outcomes[tool_name] = await _run_tool(mcp_server.tool_registry, tool_name, semaphore)
+        
+        batch = [tool_name for tool_name in tools if tool_name not in outcomes]
+        results = await asyncio.gather(
+            *(_run_tool(mcp_server.tool_registry, tool_name, semaphore) for tool_name in batch)
+        )
+        outcomes.update(zip(batch, results))
+        
+        test_results = {}
+        for tool_name in tools:
+            status, line = outcomes[tool_name]
+            test_results[tool_name] = status
+            print(f"\n🔧 Testing: {tool_name}", file=sys.stderr)
+            print(f"   Result: {line}", file=sys.stderr)
+        
+        # Summary
+        print(f"\n📊 TEST SUMMARY", file=sys.stderr)
+        print("=" * 30, file=sys.stderr)
+        
+        success_count = sum(1 for result in test_results.values() if result == "✅ Success")
+        error_count = sum(1 for result in test_results.values() if "❌" in result)
+        
+        print(f"✅ Successful: {success_count}/{len(tools)}", file=sys.stderr)
+        print(f"❌ Failed: {error_count}/{len(tools)}", file=sys.stderr)
+        
+        if error_count > 0:
+            print("\n❌ Failed Tools:", file=sys.stderr)
+            for tool_name, result in test_results.items():
+                if "❌" in result:
+                    print(f"   - {tool_name}: {result}", file=sys.stderr)
+        
+    except Exception as e:
+        print(f"❌ Tool testing failed: {e}", file=sys.stderr)
@@ -33,6 +33,8 @@ class ConfigManager:
         self.filers_config = self.api_config
         self.shares_config = self.api_config 
         self.volumes_config = self.api_config
+        # Services that have a *_config attribute; check membership instead of hasattr()
+        self.available_services = frozenset(("filers", "shares", "volumes"))
         self.server_instructions = server_instructions
         self.behavior_settings = self._load_behavior_settings()
     
@@ -80,6 +82,7 @@ class ConfigManager:
     def add_api_config(self, name: str) -> APIConfig:
         """Add configuration for a new API - reuses the same config."""
         setattr(self, f"{name}_config", self.api_config)
+        self.available_services = self.available_services | {name}
         return self.api_config
     
     def get_config_summary(self) -> Dict[str, str]:
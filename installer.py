@@ -5,27 +5,78 @@ Works on Windows, macOS, and Linux
 Downloads latest code from GitHub
 """
 
-import os
 import sys
+
+# One-shot run: don't leave __pycache__ entries behind for the modules it imports
+sys.dont_write_bytecode = True
+
+import os
 import json
-import platform
 import subprocess
 import shutil
 import getpass
+import urllib.parse
 import urllib.request
 import urllib.error
+import http.client
 import ssl
 import zipfile
 import tarfile
 import argparse
-from pathlib import Path
+import functools
+import importlib.util
+import itertools
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
 from typing import Optional, Dict, Tuple, List
 import tempfile
+import threading
 import time
 
 # GitHub repository URL
 GITHUB_REPO = "https://github.com/nasuni-labs/local-nasuni-management-mcp-server"
 GITHUB_ARCHIVE = "https://github.com/nasuni-labs/local-nasuni-management-mcp-server/archive/refs/heads/main.zip"
+GITHUB_COMMIT_API = "https://api.github.com/repos/nasuni-labs/local-nasuni-management-mcp-server/commits/main"
+
+# Downloaded archives are kept per commit SHA so reruns skip the download
+CACHE_DIR = Path.home() / ".cache" / "nmc-installer"
+
+# Archive download and extraction: buffer per read/copy, and bytes between progress redraws
+COPY_BUFFER = 128 * 1024
+PROGRESS_STEP = 1 << 20
+DOWNLOAD_ATTEMPTS = 3
+DOWNLOAD_TIMEOUT = 30
+
+# zlib releases the GIL while inflating, so archive members extract in parallel
+EXTRACT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Verified TLS; NMC_CA_BUNDLE adds a CA file for networks that intercept HTTPS
+_SSL_CONTEXT = ssl.create_default_context()
+if os.environ.get("NMC_CA_BUNDLE"):
+    _SSL_CONTEXT.load_verify_locations(os.environ["NMC_CA_BUNDLE"])
+
+# One opener for every request the installer makes, sharing the TLS context
+_OPENER = urllib.request.build_opener(urllib.request.HTTPSHandler(context=_SSL_CONTEXT))
+_OPENER.addheaders = [("User-Agent", "nmc-installer"), ("Accept-Encoding", "identity")]
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Surface redirects as HTTPError; urllib would otherwise reissue a HEAD as a GET"""
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+_HEAD_OPENER = urllib.request.build_opener(urllib.request.HTTPSHandler(context=_SSL_CONTEXT), _NoRedirect)
+_HEAD_OPENER.addheaders = _OPENER.addheaders
+
+# sys.platform is a constant; platform.system()/machine() go through platform.uname(),
+# which queries WMI on Windows, so read the same values from the cheapest source once
+_IS_WINDOWS = sys.platform.startswith("win")
+if _IS_WINDOWS:
+    _OS_TYPE, _ARCH = "Windows", os.environ.get("PROCESSOR_ARCHITECTURE", "")
+else:
+    _OS_TYPE, _ARCH = os.uname().sysname, os.uname().machine
 
 # ANSI color codes for terminal output
 class Colors:
@@ -54,7 +105,7 @@ class Colors:
 
 
 # Handle Windows terminal compatibility
-if platform.system() == 'Windows':
+if _IS_WINDOWS:
     try:
         # Try to enable ANSI escape sequences on Windows 10+
         import ctypes
@@ -72,21 +123,288 @@ else:
     # For non-Windows, colors should work
     pass
 
-class Installer:
+# Standalone configure_claude.py written when Claude Desktop isn't set up yet.
+# Placeholders: python command, path to main.py, install directory.
+_CONFIGURE_SCRIPT_TEMPLATE = r'''#!/usr/bin/env python3
+"""
+Standalone script to configure Claude Desktop for Nasuni Management MCP Server
+Run this after installing Claude Desktop
+Enhanced version with better detection and safe config updates
+"""
+
+import json
+import sys
+import shutil
+import platform
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple
+
+def find_claude_desktop() -> Tuple[bool, List[str]]:
+    """Find Claude Desktop installation"""
+    os_type = platform.system()
+    home = Path.home()
+    claude_installed = False
+    claude_locations = []
+
+    if os_type == "Darwin":  # macOS
+        app_locations = [
+            Path("/Applications/Claude.app"),
+            home / "Applications" / "Claude.app",
+            Path("/System/Applications/Claude.app"),
+            Path("/Applications/Setapp/Claude.app"),
+        ]
+        for loc in app_locations:
+            if loc.exists():
+                claude_installed = True
+                claude_locations.append(str(loc))
+
+    elif os_type == "Windows":
+        import os
+        program_locations = []
+        if os.environ.get("PROGRAMFILES"):
+            program_locations.append(Path(os.environ["PROGRAMFILES"]) / "Claude")
+        if os.environ.get("LOCALAPPDATA"):
+            program_locations.append(Path(os.environ["LOCALAPPDATA"]) / "Claude")
+            program_locations.append(Path(os.environ["LOCALAPPDATA"]) / "Programs" / "Claude")
+
+        for base in program_locations:
+            if base.exists():
+                for exe_name in ["Claude.exe", "claude.exe"]:
+                    if (base / exe_name).exists():
+                        claude_installed = True
+                        claude_locations.append(str(base / exe_name))
+
+    else:  # Linux
+        binary_locations = [
+            "/usr/bin/claude",
+            "/usr/local/bin/claude",
+            "/opt/claude/claude",
+            str(home / ".local" / "bin" / "claude"),
+        ]
+        for path in binary_locations:
+            if Path(path).exists():
+                claude_installed = True
+                claude_locations.append(path)
+
+    return claude_installed, claude_locations
+
+def get_config_paths() -> List[Path]:
+    """Get possible config file paths"""
+    os_type = platform.system()
+    home = Path.home()
+
+    if os_type == "Darwin":
+        return [
+            home / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json",
+            home / ".claude" / "claude_desktop_config.json",
+        ]
+    elif os_type == "Windows":
+        import os
+        return [
+            Path(os.environ.get("APPDATA", home / "AppData" / "Roaming")) / "Claude" / "claude_desktop_config.json",
+            Path(os.environ.get("LOCALAPPDATA", home / "AppData" / "Local")) / "Claude" / "claude_desktop_config.json",
+        ]
+    else:
+        return [
+            home / ".config" / "Claude" / "claude_desktop_config.json",
+            home / ".config" / "claude" / "claude_desktop_config.json",
+            home / ".claude" / "claude_desktop_config.json",
+        ]
+
+def configure_claude():
+    python_cmd = "%s"
+    main_py = "%s"
+    cwd = "%s"
+
+    # Check if Claude is installed
+    installed, locations = find_claude_desktop()
+    if not installed:
+        print("❌ Claude Desktop not found")
+        print("Please install from: https://claude.ai/download")
+        return False
+
+    print(f"✅ Claude Desktop found")
+
+    # Find config file
+    config_paths = get_config_paths()
+    config_file = None
+
+    for path in config_paths:
+        if path.exists():
+            config_file = path
+            print(f"✅ Found config: {path}")
+            break
+        elif path.parent.exists():
+            config_file = path
+            print(f"📝 Will create config at: {path}")
+            break
+
+    if not config_file:
+        # Create directory for first option
+        config_file = config_paths[0]
+        config_file.parent.mkdir(parents=True, exist_ok=True)
+        print(f"📁 Created config directory: {config_file.parent}")
+
+    # Load or create config
+    if config_file.exists():
+        # Backup existing config
+        backup = config_file.with_suffix('.json.backup')
+        shutil.copy2(config_file, backup)
+        print(f"📋 Backed up to: {backup}")
+
+        with open(config_file, 'r', encoding='utf-8') as f:
+            try:
+                config = json.load(f)
+            except:
+                print("⚠️ Invalid JSON, creating new config")
+                config = {}
+    else:
+        config = {}
+
+    # Add MCP server (preserving existing servers)
+    if "mcpServers" not in config:
+        config["mcpServers"] = {}
+
+    # Show existing servers
+    existing = [k for k in config["mcpServers"] if k != "nasuni-management"]
+    if existing:
+        print(f"ℹ️ Preserving {len(existing)} existing MCP server(s)")
+
+    config["mcpServers"]["nasuni-management"] = {
+        "command": python_cmd,
+        "args": [main_py],
+        "cwd": cwd
+    }
+
+    # Save config
+    with open(config_file, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+    print("✅ Claude Desktop configured successfully!")
+    print(f"   Config: {config_file}")
+    print("\n🚀 Please restart Claude Desktop to use Nasuni Management MCP tools")
+    return True
+
+if __name__ == "__main__":
+    try:
+        success = configure_claude()
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+'''
+
+
+# Where to look for Claude Desktop on this OS. app_paths holds groups of
+# alternative paths (first hit per group wins), path_binaries are names to
+# look up on PATH, appimage_dirs are scanned for *laude*.AppImage files.
+_ClaudeCandidates = namedtuple(
+    "_ClaudeCandidates", ["app_paths", "config_paths", "path_binaries", "appimage_dirs"]
+)
+
+
+def _extract_members(zip_ref: zipfile.ZipFile, members: List[zipfile.ZipInfo], dest: Path):
+    """Extract members into dest on a thread pool, yielding once per finished file"""
+    # ZipFile.extract creates missing parents with an unguarded makedirs that
+    # races between threads, so lay out every directory first
+    files = []
+    for member in members:
+        parts = PurePosixPath(member.filename).parts
+        if member.filename.startswith("/") or ".." in parts:
+            raise ValueError(f"Unsafe path in archive: {member.filename}")
+        if member.is_dir():
+            dest.joinpath(*parts).mkdir(parents=True, exist_ok=True)
+        else:
+            if len(parts) > 1:
+                dest.joinpath(*parts[:-1]).mkdir(parents=True, exist_ok=True)
+            files.append(member)
+    
+    # ZipFile.extract copies through shutil's default buffer; use the larger one.
+    # Members are read straight from the file: ZipFile rejects a bare mmap before
+    # Python 3.13 (no seekable()), and an in-memory copy measured no faster, as
+    # creating the files dominates.
+    def extract(member: zipfile.ZipInfo):
+        target = dest.joinpath(*PurePosixPath(member.filename).parts)
+        with zip_ref.open(member) as source, open(target, "wb") as out:
+            shutil.copyfileobj(source, out, COPY_BUFFER)
+    
+    with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as executor:
+        yield from executor.map(extract, files)
+
+
+def _write_block(lines: List[str]):
+    """Print a block of lines with one write and flush instead of a print per line"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def _atomic_write(path: Path, text: str, mode: Optional[int] = None):
+    """Write text via a sibling temp file and os.replace, so a crash never leaves a partial file
+
+    The file is created with mode (subject to the umask); without one it keeps
+    the mode of the file it replaces.
+    """
+    # Replace the target of a symlink rather than the link itself
+    path = Path(os.path.realpath(path))
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        # O_BINARY: newline translation is left to the text wrapper, not done twice on Windows
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp, flags, 0o666 if mode is None else mode)
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        if mode is None and path.exists():
+            shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _extract_native(zip_path: Path, dest: Path) -> Optional[str]:
+    """Unpack zip_path into dest with a native tool; return its name, or None to fall back.
 
-    #boolen to check if claude was successfully configured
-    global claude_configured 
-    claude_configured = False
+    bsdtar reads zip archives and ships as ``tar`` on macOS and Windows 10+.
+    GNU tar can't, so on Linux only an explicit bsdtar or Info-ZIP unzip is used.
+    """
+    commands = []
+    tar = shutil.which("bsdtar") or (None if sys.platform.startswith("linux") else shutil.which("tar"))
+    if tar:
+        commands.append([tar, "-xf", str(zip_path), "-C", str(dest)])
+    unzip = shutil.which("unzip")
+    if unzip:
+        commands.append([unzip, "-q", "-o", str(zip_path), "-d", str(dest)])
+    
+    for command in commands:
+        try:
+            subprocess.run(command, check=True, capture_output=True, timeout=120)
+        except (subprocess.SubprocessError, OSError):
+            continue
+        return Path(command[0]).stem
+    return None
+
+
+class Installer:
 
     def __init__(self, args=None):
-        self.os_type = platform.system()
-        self.arch = platform.machine()
+        self.os_type = _OS_TYPE
+        self.arch = _ARCH
         self.home = Path.home()
+        self._home_s = str(self.home)
         self.install_dir = None
         self.python_cmd = None
         self.pip_cmd = None
         self.venv_path = None
         self.config = {}
+        # Background compileall started once dependencies are installed
+        self.bytecode_job = None
+        # Claude Desktop detection and the GitHub archive lookup, run in the
+        # background while earlier steps and prompts proceed
+        self.claude_probe = None
+        self.archive_lookup = None
+        # Whether configure_claude_desktop completed successfully
+        self.claude_configured = False
         
         # Handle arguments
         if args is None:
@@ -109,24 +427,28 @@ class Installer:
     def print_header(self):
         """Print welcome header"""
         try:
-            print(f"\n{Colors.CYAN}{'='*60}{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.HEADER}🚀 Nasuni Management MCP Server Universal Installer{Colors.ENDC}")
-            print(f"{Colors.CYAN}{'='*60}{Colors.ENDC}")
-            print(f"OS: {Colors.GREEN}{self.os_type}{Colors.ENDC}")
-            print(f"Architecture: {Colors.GREEN}{self.arch}{Colors.ENDC}")
-            print(f"Python: {Colors.GREEN}{sys.version.split()[0]}{Colors.ENDC}")
-            print(f"Repository: {Colors.GREEN}{GITHUB_REPO}{Colors.ENDC}")
-            print(f"{Colors.CYAN}{'='*60}{Colors.ENDC}\n")
+            _write_block([
+                f"\n{Colors.CYAN}{'='*60}{Colors.ENDC}",
+                f"{Colors.BOLD}{Colors.HEADER}🚀 Nasuni Management MCP Server Universal Installer{Colors.ENDC}",
+                f"{Colors.CYAN}{'='*60}{Colors.ENDC}",
+                f"OS: {Colors.GREEN}{self.os_type}{Colors.ENDC}",
+                f"Architecture: {Colors.GREEN}{self.arch}{Colors.ENDC}",
+                f"Python: {Colors.GREEN}{sys.version.split()[0]}{Colors.ENDC}",
+                f"Repository: {Colors.GREEN}{GITHUB_REPO}{Colors.ENDC}",
+                f"{Colors.CYAN}{'='*60}{Colors.ENDC}\n",
+            ])
         except Exception as e:
             # Fallback without colors if there's any issue
-            print("\n" + "="*60)
-            print("Nasuni Management MCP Server Universal Installer")
-            print("="*60)
-            print(f"OS: {self.os_type}")
-            print(f"Architecture: {self.arch}")
-            print(f"Python: {sys.version.split()[0]}")
-            print(f"Repository: {GITHUB_REPO}")
-            print("="*60 + "\n")
+            _write_block([
+                "\n" + "="*60,
+                "Nasuni Management MCP Server Universal Installer",
+                "="*60,
+                f"OS: {self.os_type}",
+                f"Architecture: {self.arch}",
+                f"Python: {sys.version.split()[0]}",
+                f"Repository: {GITHUB_REPO}",
+                "="*60 + "\n",
+            ])
     
     def check_python(self) -> bool:
         """Check if Python 3.10+ is installed"""
@@ -145,15 +467,10 @@ class Installer:
         # Find pip command - prefer using python -m pip
         self.pip_cmd = f'"{self.python_cmd}" -m pip'
         
-        # Test if pip is available
+        # Test if pip is available; python_cmd is this interpreter, so look for
+        # the module directly instead of spawning "python -m pip --version"
         try:
-            result = subprocess.run(
-                [self.python_cmd, "-m", "pip", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode != 0:
+            if importlib.util.find_spec("pip") is None:
                 print(f"{Colors.WARNING}⚠️  pip not found, attempting to install...{Colors.ENDC}")
                 # Try to bootstrap pip
                 try:
@@ -176,7 +493,7 @@ class Installer:
         """Provide instructions for installing Python"""
         print(f"\n{Colors.HEADER}📦 Python Installation Instructions:{Colors.ENDC}\n")
         
-        if self.os_type == "Windows":
+        if _IS_WINDOWS:
             print("1. Download Python from: https://www.python.org/downloads/")
             print("2. Run the installer and CHECK 'Add Python to PATH'")
             print("3. Restart this installer after Python is installed")
@@ -196,6 +513,112 @@ class Installer:
             print("  sudo pacman -S python python-pip")
     
     
+    def _latest_commit(self) -> Optional[str]:
+        """SHA of the main branch head, or None if GitHub can't be asked"""
+        etag_file = CACHE_DIR / "main.etag"
+        request = urllib.request.Request(GITHUB_COMMIT_API, headers={"Accept": "application/vnd.github.sha"})
+        try:
+            sha, etag = etag_file.read_text().split("\n", 1)
+            request.add_header("If-None-Match", etag)
+        except (OSError, ValueError):
+            sha = None
+        
+        try:
+            with _OPENER.open(request, timeout=DOWNLOAD_TIMEOUT) as response:
+                sha = response.read().decode("ascii", "replace").strip()
+                etag = response.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            # 304 means main hasn't moved, and doesn't count against the API rate limit
+            return sha if e.code == 304 else None
+        except (urllib.error.URLError, OSError, http.client.HTTPException):
+            return None
+        
+        if len(sha) != 40 or not sha.isalnum():
+            return None
+        if etag:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                etag_file.write_text(f"{sha}\n{etag}")
+            except OSError:
+                pass
+        return sha
+    
+    def _resolve_archive(self, follow_redirect: bool = False) -> Tuple[Optional[str], str]:
+        """
+        Look up the commit SHA of main and the archive URL to download
+        With follow_redirect, a HEAD request resolves the URL to the host that serves
+        it, which saves the redirect hop and its TLS handshake on the actual download
+        """
+        sha = self._latest_commit()
+        url = f"{GITHUB_REPO}/archive/{sha}.zip" if sha else GITHUB_ARCHIVE
+        if follow_redirect:
+            try:
+                _HEAD_OPENER.open(urllib.request.Request(url, method="HEAD"), timeout=DOWNLOAD_TIMEOUT).close()
+            except urllib.error.HTTPError as e:
+                location = e.headers.get("Location")
+                if e.code in (301, 302, 303, 307, 308) and location:
+                    url = urllib.parse.urljoin(url, location)
+            except (urllib.error.URLError, OSError, http.client.HTTPException):
+                pass
+        return sha, url
+    
+    def _download_archive(self, url: str, zip_path: Path, show_progress: bool) -> int:
+        """Download the GitHub archive to zip_path, resuming after dropped connections"""
+        for attempt in range(DOWNLOAD_ATTEMPTS):
+            try:
+                return self._stream_archive(url, zip_path, show_progress)
+            except urllib.error.HTTPError as e:
+                # 416 answers a Range past the end: the .part already holds the
+                # whole archive, or it is corrupt and has to start over
+                if e.code == 416 and zipfile.is_zipfile(zip_path):
+                    return zip_path.stat().st_size
+                zip_path.unlink(missing_ok=True)
+                if e.code != 416 or attempt == DOWNLOAD_ATTEMPTS - 1:
+                    raise
+            except (urllib.error.URLError, OSError, http.client.HTTPException):
+                if attempt == DOWNLOAD_ATTEMPTS - 1:
+                    raise
+                time.sleep(2 ** attempt)
+    
+    def _stream_archive(self, url: str, zip_path: Path, show_progress: bool) -> int:
+        """Stream the archive to zip_path; returns the size of the finished file"""
+        request = urllib.request.Request(url)
+        downloaded = zip_path.stat().st_size if zip_path.exists() else 0
+        if downloaded:
+            request.add_header("Range", f"bytes={downloaded}-")
+        write, flush = sys.stdout.write, sys.stdout.flush
+        
+        with _OPENER.open(request, timeout=DOWNLOAD_TIMEOUT) as response:
+            # 206 continues a partial file; a plain 200 means the server restarted it
+            if response.status != 206:
+                downloaded = 0
+            last_drawn = downloaded
+            # GitHub usually streams archives chunked, without a Content-Length
+            length = int(response.headers.get("Content-Length") or 0)
+            total = downloaded + length if length else 0
+            
+            with open(zip_path, "ab" if downloaded else "wb") as out:
+                while True:
+                    chunk = response.read(COPY_BUFFER)
+                    if not chunk:
+                        break
+                    out.write(chunk)
+                    downloaded += len(chunk)
+                    
+                    if show_progress and downloaded - last_drawn >= PROGRESS_STEP:
+                        last_drawn = downloaded
+                        if total:
+                            write(f"\rDownloading: {downloaded * 100 // total}% ({downloaded / 1048576:.1f} MB)")
+                        else:
+                            write(f"\rDownloading: {downloaded / 1048576:.1f} MB")
+                        flush()
+        
+        if show_progress:
+            # Pad over the longer percentage line it replaces
+            write(f"\rDownloaded: {downloaded / 1048576:.1f} MB".ljust(40))
+            flush()
+        return downloaded
+    
     def download_from_github(self) -> bool:
         """Download latest code from GitHub"""
         print(f"\n{Colors.BLUE}📥 Downloading latest version from GitHub...{Colors.ENDC}")
@@ -215,57 +638,94 @@ class Installer:
             if response != 'y':
                 print(f"{Colors.RED}Installation cancelled{Colors.ENDC}")
                 return False
-            shutil.rmtree(self.install_dir, ignore_errors=True)
+            # Move the old tree aside (a single rename) and delete it in the background
+            # rather than walking it, venv included, before the download can start
+            old_dir = self.install_dir.with_name(f"{self.install_dir.name}.old.{os.getpid()}")
+            try:
+                self.install_dir.rename(old_dir)
+            except OSError:
+                shutil.rmtree(self.install_dir, ignore_errors=True)
+            else:
+                threading.Thread(target=shutil.rmtree, args=(old_dir,), kwargs={"ignore_errors": True}).start()
         
         # Create directory
         self.install_dir.mkdir(parents=True, exist_ok=True)
         
         # Download from GitHub
         try:
-            # Create SSL context that doesn't verify certificates (for simplicity)
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
             with tempfile.TemporaryDirectory() as temp_dir:
                 temp_path = Path(temp_dir)
                 zip_path = temp_path / "nasuni-management-mcp-server.zip"
+                cached = None
+                if self.archive_lookup is not None:
+                    sha, url = self.archive_lookup.result()
+                else:
+                    sha, url = self._resolve_archive()
                 
-                
-                print(f"Downloading from: {GITHUB_ARCHIVE}")
-                print("This may take a moment...")
-                
-                # For Windows or quiet mode, minimize output
-                if self.os_type == "Windows" or self.args.quiet:
-                    # Simple download without progress on Windows
+                # Archives of a commit never change, so one already downloaded for the
+                # current head of main can be reused; a .part file resumes a broken run
+                if sha:
                     try:
-                        print("Downloading... ", end='', flush=True)
-                        urllib.request.urlretrieve(GITHUB_ARCHIVE, zip_path)
-                        print("Done!")
-                    except Exception as e:
-                        print(f"Failed: {e}")
-                        raise
+                        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                        cached = CACHE_DIR / f"{sha}.zip"
+                        zip_path = CACHE_DIR / f"{sha}.zip.part"
+                    except OSError:
+                        pass
+                
+                if cached and cached.exists():
+                    zip_path = cached
+                    print(f"Using cached archive for commit {sha[:7]}")
                 else:
-                    # Progress bar for Unix-like systems
-                    urllib.request.urlretrieve(
-                        GITHUB_ARCHIVE, 
-                        zip_path
-                    )
-                    print()  # New line after progress bar
+                    print(f"Downloading from: {url}")
+                    print("This may take a moment...")
+                    
+                    # For Windows or quiet mode, minimize output
+                    if _IS_WINDOWS or self.args.quiet:
+                        # Simple download without progress on Windows
+                        try:
+                            print("Downloading... ", end='', flush=True)
+                            self._download_archive(url, zip_path, show_progress=False)
+                            print("Done!")
+                        except Exception as e:
+                            print(f"Failed: {e}")
+                            raise
+                    else:
+                        # Progress bar for Unix-like systems
+                        self._download_archive(url, zip_path, show_progress=True)
+                        print()  # New line after progress bar
+                    
+                    if cached:
+                        # A stream cut short without a Content-Length must not be cached
+                        if not zipfile.is_zipfile(zip_path):
+                            zip_path.unlink()
+                            raise Exception("Downloaded archive is incomplete")
+                        os.replace(zip_path, cached)
+                        zip_path = cached
+                        for old in CACHE_DIR.glob("*.zip"):
+                            if old != cached:
+                                old.unlink(missing_ok=True)
                 
-                # Extract zip file
+                # Extract zip file. This can't overlap the download: a zip's central
+                # directory is at the end of the archive, so nothing can be located
+                # until the last bytes arrive.
                 print(f"{Colors.BLUE}📦 Extracting files...{Colors.ENDC}")
                 
+                # Native extractors outrun zipfile; use them when installed
+                native = _extract_native(zip_path, self.install_dir)
+                if native:
+                    print(f"Extracted with {native} - Done!")
                 # For Windows or quiet mode, extract quietly to avoid console overflow
-                if self.os_type == "Windows" or self.args.quiet:
+                elif _IS_WINDOWS or self.args.quiet:
                     print("Extracting archive... ", end='', flush=True)
                     try:
                         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                            members = zip_ref.infolist()
                             # Get total number of files
-                            total_files = len(zip_ref.namelist())
+                            total_files = len(members)
                             
                             # Extract without verbose output
-                            zip_ref.extractall(temp_path)
+                            for _ in _extract_members(zip_ref, members, self.install_dir):
+                                pass
                         
                         print(f"Done! ({total_files} files)")
                     except Exception as e:
@@ -274,38 +734,49 @@ class Installer:
                 else:
                     # More verbose extraction for Unix-like systems
                     with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                        total_files = len(zip_ref.namelist())
+                        members = zip_ref.infolist()
+                        total_files = len(members)
                         print(f"Extracting {total_files} files...")
                         
-                        # Extract with simple progress
-                        for i, file in enumerate(zip_ref.namelist()):
-                            if i % 10 == 0:  # Update every 10 files
-                                print(f'\rExtracting: {i}/{total_files} files', end='', flush=True)
-                            zip_ref.extract(file, temp_path)
+                        # Extract with simple progress; the only high-volume output in the installer.
+                        # Directories are created before any file, so count them as done.
+                        write, flush = sys.stdout.write, sys.stdout.flush
+                        done = sum(1 for member in members if member.is_dir())
+                        for _ in _extract_members(zip_ref, members, self.install_dir):
+                            if done % 10 == 0:  # Update every 10 files
+                                write(f'\rExtracting: {done}/{total_files} files')
+                                flush()
+                            done += 1
                         
                         print(f'\rExtracted: {total_files}/{total_files} files - Done!')
                 
-                # Find the extracted directory (GitHub adds -main suffix)
-                extracted_dirs = [d for d in temp_path.iterdir() if d.is_dir()]
-                if not extracted_dirs:
+                # Everything sits under one top-level folder (GitHub adds -main suffix);
+                # lift its entries into place by renaming rather than copying them again
+                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                    names = zip_ref.namelist()
+                top_level = {name.split('/', 1)[0] for name in names}
+                source_dir = self.install_dir / top_level.pop()
+                if top_level or not source_dir.is_dir():
                     raise Exception("No directory found in archive")
                 
-                source_dir = extracted_dirs[0]
-                
-                # Move files to installation directory
                 print("Installing files... ", end='', flush=True)
-                files_copied = 0
                 for item in source_dir.iterdir():
-                    dest = self.install_dir / item.name
-                    if item.is_dir():
-                        shutil.copytree(item, dest, dirs_exist_ok=True)
-                        # Count files in directory
-                        files_copied += sum(1 for _ in item.rglob('*') if _.is_file())
-                    else:
-                        shutil.copy2(item, dest)
-                        files_copied += 1
+                    target = self.install_dir / item.name
+                    # The old tree may not have gone away completely (locked files on
+                    # Windows); replace what it left, since rename won't overwrite a directory
+                    try:
+                        if target.is_dir() and not target.is_symlink():
+                            shutil.rmtree(target)
+                        item.replace(target)
+                    except OSError as e:
+                        raise Exception(
+                            f"Could not replace {target} from the previous install ({e}). "
+                            "Close any program using it and run the installer again."
+                        )
+                source_dir.rmdir()
                 
-                print(f"Done! ({files_copied} files installed)")
+                files_installed = sum(1 for name in names if not name.endswith('/'))
+                print(f"Done! ({files_installed} files installed)")
                 print(f"{Colors.GREEN}✅ Downloaded to: {self.install_dir}{Colors.ENDC}")
                 return True
                 
@@ -320,22 +791,17 @@ class Installer:
         print(f"\n{Colors.BLUE}🔧 Setting up virtual environment...{Colors.ENDC}")
         
         self.venv_path = self.install_dir / "venv"
+        # uv creates the venv and resolves/fetches wheels in parallel; pip is the fallback
+        uv = shutil.which("uv")
         
         # First, ensure the venv module is available
         try:
-            # Check if venv module exists
-            result = subprocess.run(
-                [self.python_cmd, "-c", "import venv"],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode != 0:
+            # Check if venv module exists; python_cmd is this interpreter, so no subprocess needed
+            if uv is None and importlib.util.find_spec("venv") is None:
                 print(f"{Colors.WARNING}⚠️ venv module not found. Attempting to install...{Colors.ENDC}")
                 
                 # Try to install venv (on some systems it's separate)
-                if self.os_type == "Windows":
+                if _IS_WINDOWS:
                     print("On Windows, venv should be included with Python.")
                     print("Try reinstalling Python from python.org with standard library included.")
                 else:
@@ -383,18 +849,26 @@ class Installer:
                 print("Removing existing venv directory...")
                 shutil.rmtree(self.venv_path, ignore_errors=True)
             
-            # Create venv with explicit options for better compatibility
-            result = subprocess.run(
-                [self.python_cmd, "-m", "venv", str(self.venv_path), "--clear"],
-                capture_output=True,
-                text=True,
-                timeout=120  # Increased timeout
-            )
+            if uv:
+                # --seed keeps pip in the venv, as venv.create(with_pip=True) would
+                result = subprocess.run(
+                    [uv, "venv", "--seed", "--python", self.python_cmd, str(self.venv_path)],
+                    capture_output=True,
+                    text=True,
+                    timeout=120
+                )
+                if result.returncode != 0:
+                    print(f"{Colors.WARNING}uv venv failed, falling back to venv: {result.stderr}{Colors.ENDC}")
+                    uv = None
             
-            if result.returncode != 0:
+            # Create venv in-process (only ensurepip still runs as a child process)
+            try:
+                if not uv:
+                    import venv
+                    venv.create(self.venv_path, clear=True, with_pip=True)
+            except (OSError, subprocess.CalledProcessError) as e:
                 print(f"{Colors.RED}venv creation failed with error:{Colors.ENDC}")
-                print(f"STDOUT: {result.stdout}")
-                print(f"STDERR: {result.stderr}")
+                print(f"ERROR: {e}")
                 
                 # Try without extra options
                 print(f"{Colors.BLUE}Trying simplified venv creation...{Colors.ENDC}")
@@ -410,7 +884,7 @@ class Installer:
                     return self.setup_without_venv()
             
             # Get venv Python and pip paths
-            if self.os_type == "Windows":
+            if _IS_WINDOWS:
                 venv_python = self.venv_path / "Scripts" / "python.exe"
                 venv_pip = self.venv_path / "Scripts" / "pip.exe"
             else:
@@ -422,38 +896,51 @@ class Installer:
                 print(f"{Colors.RED}Virtual environment not created properly{Colors.ENDC}")
                 return self.setup_without_venv()
             
-            # Upgrade pip
-            print(f"{Colors.BLUE}📦 Upgrading pip...{Colors.ENDC}")
-            result = subprocess.run(
-                [str(venv_python), "-m", "pip", "install", "--upgrade", "pip"],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode != 0:
-                print(f"{Colors.WARNING}Could not upgrade pip: {result.stderr}{Colors.ENDC}")
-            
-            # Install requirements
+            # Upgrade pip and install requirements in a single pip run; a uv-seeded
+            # pip is already current, so uv only needs to install the requirements
             requirements_file = self.install_dir / "requirements.txt"
+            if uv:
+                pip_install = [uv, "pip", "install", "--python", str(venv_python)]
+            else:
+                pip_install = [
+                    str(venv_python), "-m", "pip", "install", "--upgrade", "pip",
+                    "--upgrade-strategy", "only-if-needed", "--disable-pip-version-check", "--no-compile"
+                ]
             if requirements_file.exists():
-                print(f"{Colors.BLUE}📦 Installing dependencies...{Colors.ENDC}")
+                action = "Installing dependencies with uv" if uv else "Upgrading pip and installing dependencies"
+                print(f"{Colors.BLUE}📦 {action}...{Colors.ENDC}")
                 print("This may take a few minutes...")
-                
+                pip_install += ["-r", str(requirements_file)]
+            elif not uv:
+                print(f"{Colors.BLUE}📦 Upgrading pip...{Colors.ENDC}")
+            
+            if requirements_file.exists() or not uv:
                 result = subprocess.run(
-                    [str(venv_python), "-m", "pip", "install", "-r", str(requirements_file)],
+                    pip_install,
                     capture_output=True,
                     text=True,
                     timeout=300  # 5 minutes timeout
                 )
-                
+            
+            if requirements_file.exists():
                 if result.returncode != 0:
                     print(f"{Colors.RED}Failed to install dependencies:{Colors.ENDC}")
                     print(result.stderr)
                     return False
                     
                 print(f"{Colors.GREEN}✅ Dependencies installed{Colors.ENDC}")
+                
+                # pip ran with --no-compile (uv never compiles); emit bytecode on all
+                # cores while the user works through the configuration prompts
+                site_root = self.venv_path / ("Lib" if _IS_WINDOWS else "lib")
+                self.bytecode_job = subprocess.Popen(
+                    [str(venv_python), "-m", "compileall", "-q", "-j", "0", str(site_root)],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
             else:
+                if not uv and result.returncode != 0:
+                    print(f"{Colors.WARNING}Could not upgrade pip: {result.stderr}{Colors.ENDC}")
                 print(f"{Colors.WARNING}⚠️  No requirements.txt found{Colors.ENDC}")
             
             self.python_cmd = str(venv_python)
@@ -594,7 +1081,7 @@ API_TIMEOUT=30.0
 """
         
         try:
-            env_file.write_text(env_content)
+            _atomic_write(env_file, env_content)
             print(f"{Colors.GREEN}✅ Configuration saved to .env file{Colors.ENDC}")
             
             # Store config for Claude setup
@@ -623,7 +1110,7 @@ VERIFY_SSL=false
 API_TIMEOUT=30.0
 """
         try:
-            sample_env.write_text(env_content)
+            _atomic_write(sample_env, env_content)
             print(f"{Colors.YELLOW}📝 Created sample configuration: {sample_env}{Colors.ENDC}")
             print(f"   Edit this file with your credentials and rename to .env")
         except Exception as e:
@@ -704,205 +1191,228 @@ API_TIMEOUT=30.0
 
 
     
-    def check_claude_desktop(self) -> Tuple[bool, List[str], List[Path]]:
-        """
-        Enhanced Claude Desktop detection
-        Returns: (is_installed, app_locations, config_paths)
-        """
-        claude_installed = False
-        claude_locations = []
-        possible_config_paths = []
+    @functools.cached_property
+    def _candidate_paths(self) -> _ClaudeCandidates:
+        """Claude Desktop install and config candidates for this OS, built once"""
+        join = os.path.join
+        home = self._home_s
         
         if self.os_type == "Darwin":  # macOS
             # Application locations
             app_locations = [
-                Path("/Applications/Claude.app"),
-                self.home / "Applications" / "Claude.app",
-                Path("/System/Applications/Claude.app"),
+                "/Applications/Claude.app",
+                join(home, "Applications", "Claude.app"),
+                "/System/Applications/Claude.app",
                 # Additional possible locations
-                Path("/Applications/Setapp/Claude.app"),  # Setapp installation
-                self.home / "Applications" / "Setapp" / "Claude.app",
+                "/Applications/Setapp/Claude.app",  # Setapp installation
+                join(home, "Applications", "Setapp", "Claude.app"),
             ]
             
-            for loc in app_locations:
-                if loc.exists():
-                    claude_installed = True
-                    claude_locations.append(str(loc))
-            
             # Config file locations
             possible_config_paths = [
-                self.home / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json",
-                self.home / ".claude" / "claude_desktop_config.json",
-                self.home / "Library" / "Preferences" / "Claude" / "claude_desktop_config.json",
+                join(home, "Library", "Application Support", "Claude", "claude_desktop_config.json"),
+                join(home, ".claude", "claude_desktop_config.json"),
+                join(home, "Library", "Preferences", "Claude", "claude_desktop_config.json"),
                 # Additional fallback locations
-                self.home / ".config" / "claude" / "claude_desktop_config.json",
-                self.home / ".config" / "Claude" / "claude_desktop_config.json",
+                join(home, ".config", "claude", "claude_desktop_config.json"),
+                join(home, ".config", "Claude", "claude_desktop_config.json"),
             ]
+            
+            app_paths = tuple((loc,) for loc in app_locations)
+            path_binaries = ()
+            appimage_dirs = ()
                     
-        elif self.os_type == "Windows":
+        elif _IS_WINDOWS:
+            # Snapshot the environment once; each os.environ lookup on Windows
+            # does a case-insensitive scan of the whole block
+            env = os.environ
+            pf = env.get("PROGRAMFILES")
+            pfx86 = env.get("PROGRAMFILES(X86)")
+            localapp = env.get("LOCALAPPDATA")
+            appdata = env.get("APPDATA")
+            userprofile = env.get("USERPROFILE")
+            programdata = env.get("PROGRAMDATA", "C:\\ProgramData")
+
             # Check various Windows installation paths
             program_locations = []
             
             # Standard Program Files locations
-            if os.environ.get("PROGRAMFILES"):
-                program_locations.append(Path(os.environ["PROGRAMFILES"]) / "Claude")
-            if os.environ.get("PROGRAMFILES(X86)"):
-                program_locations.append(Path(os.environ["PROGRAMFILES(X86)"]) / "Claude")
+            if pf:
+                program_locations.append(join(pf, "Claude"))
+            if pfx86:
+                program_locations.append(join(pfx86, "Claude"))
             
             # User-specific installations
-            if os.environ.get("LOCALAPPDATA"):
-                local_appdata = Path(os.environ["LOCALAPPDATA"])
+            if localapp:
                 program_locations.extend([
-                    local_appdata / "Claude",
-                    local_appdata / "Programs" / "Claude",
-                    local_appdata / "Microsoft" / "WindowsApps" / "Claude",
-                    local_appdata /"AnthropicClaude",    # MS Store apps
+                    join(localapp, "Claude"),
+                    join(localapp, "Programs", "Claude"),
+                    join(localapp, "Microsoft", "WindowsApps", "Claude"),
+                    join(localapp, "AnthropicClaude"),    # MS Store apps
                 ])
 
             # User-specific installations
-            if os.environ.get("APPDATA"):
-                local_appdata = Path(os.environ["APPDATA"])
+            if appdata:
                 program_locations.extend([
-                    local_appdata / "Local"/"AnthropicClaude",
+                    join(appdata, "Local", "AnthropicClaude"),
                 ])
             
-            # Check for Claude executable
-            for base in program_locations:
-                if base.exists():
-                    # Check for various executable names
-                    for exe_name in ["Claude.exe", "claude.exe", "Claude Desktop.exe"]:
-                        claude_exe = base / exe_name
-                        if claude_exe.exists():
-                            claude_installed = True
-                            claude_locations.append(str(claude_exe))
-                            break
-            
-            # Also check if Claude is in PATH
-            claude_in_path = shutil.which("claude") or shutil.which("Claude")
-            if claude_in_path:
-                claude_installed = True
-                claude_locations.append(claude_in_path)
-            
-            # Check Start Menu for shortcuts (indicates installation)
-            if os.environ.get("APPDATA"):
+            # Start Menu shortcuts (indicate installation)
+            start_menu_locations = []
+            if appdata:
+                start_menu = join(appdata, "Microsoft", "Windows", "Start Menu", "Programs")
                 start_menu_locations = [
-                    Path(os.environ["APPDATA"]) / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Claude.lnk",
-                    Path(os.environ["APPDATA"]) / "Microsoft" / "Windows" / "Start Menu" / "Programs" / "Claude" / "Claude.lnk",
+                    join(start_menu, "Claude.lnk"),
+                    join(start_menu, "Claude", "Claude.lnk"),
                 ]
-                for shortcut in start_menu_locations:
-                    if shortcut.exists():
-                        claude_installed = True
-                        if str(shortcut) not in claude_locations:
-                            claude_locations.append(str(shortcut))
             
             # Config file locations for Windows
             possible_config_paths = [
-                Path(os.environ.get("APPDATA", self.home / "AppData" / "Roaming")) / "Claude" / "claude_desktop_config.json",
-                Path(os.environ.get("LOCALAPPDATA", self.home / "AppData" / "Local")) / "Claude" / "claude_desktop_config.json",
-                self.home / ".claude" / "claude_desktop_config.json",
+                join(appdata or join(home, "AppData", "Roaming"), "Claude", "claude_desktop_config.json"),
+                join(localapp or join(home, "AppData", "Local"), "Claude", "claude_desktop_config.json"),
+                join(home, ".claude", "claude_desktop_config.json"),
                 # Additional possible locations
-                Path(os.environ.get("USERPROFILE", self.home)) / ".claude" / "claude_desktop_config.json",
-                Path(os.environ.get("PROGRAMDATA", "C:\\ProgramData")) / "Claude" / "claude_desktop_config.json",
+                join(userprofile or home, ".claude", "claude_desktop_config.json"),
+                join(programdata, "Claude", "claude_desktop_config.json"),
             ]
             
+            # One executable per install directory, under any of its known names
+            exe_names = ("Claude.exe", "claude.exe", "Claude Desktop.exe")
+            app_paths = tuple(
+                tuple(join(base, exe_name) for exe_name in exe_names)
+                for base in program_locations
+            ) + tuple((shortcut,) for shortcut in start_menu_locations)
+            path_binaries = ("claude", "Claude")
+            appimage_dirs = ()
+            
         else:  # Linux
             # Check various Linux installation methods
             
             # Desktop file locations (indicates proper installation)
             desktop_files = [
-                self.home / ".local" / "share" / "applications" / "claude.desktop",
-                self.home / ".local" / "share" / "applications" / "claude-desktop.desktop",
-                Path("/usr/share/applications/claude.desktop"),
-                Path("/usr/share/applications/claude-desktop.desktop"),
-                Path("/usr/local/share/applications/claude.desktop"),
-                Path("/var/lib/flatpak/exports/share/applications/com.anthropic.claude.desktop"),  # Flatpak
-                self.home / ".local/share/flatpak/exports/share/applications/com.anthropic.claude.desktop",  # User Flatpak
-                Path("/var/lib/snapd/desktop/applications/claude.desktop"),  # Snap
+                join(home, ".local", "share", "applications", "claude.desktop"),
+                join(home, ".local", "share", "applications", "claude-desktop.desktop"),
+                "/usr/share/applications/claude.desktop",
+                "/usr/share/applications/claude-desktop.desktop",
+                "/usr/local/share/applications/claude.desktop",
+                "/var/lib/flatpak/exports/share/applications/com.anthropic.claude.desktop",  # Flatpak
+                join(home, ".local/share/flatpak/exports/share/applications/com.anthropic.claude.desktop"),  # User Flatpak
+                "/var/lib/snapd/desktop/applications/claude.desktop",  # Snap
             ]
             
-            for loc in desktop_files:
-                if loc.exists():
-                    claude_installed = True
-                    claude_locations.append(str(loc))
-            
             # Check for binary in common locations
             binary_locations = [
                 "/usr/bin/claude",
                 "/usr/local/bin/claude",
                 "/opt/claude/claude",
                 "/opt/Claude/Claude",
-                str(self.home / ".local" / "bin" / "claude"),
+                join(home, ".local", "bin", "claude"),
                 "/snap/bin/claude",  # Snap installation
                 "/var/lib/flatpak/app/com.anthropic.claude/current/active/files/bin/claude",  # Flatpak
             ]
             
-            for binary_path in binary_locations:
-                if Path(binary_path).exists():
-                    claude_installed = True
-                    claude_locations.append(binary_path)
-            
-            # Check if claude is in PATH
-            claude_bin = shutil.which("claude") or shutil.which("Claude")
-            if claude_bin:
-                claude_installed = True
-                if claude_bin not in claude_locations:
-                    claude_locations.append(claude_bin)
-            
-            # AppImage check
-            downloads_dir = self.home / "Downloads"
-            if downloads_dir.exists():
-                for appimage in downloads_dir.glob("*laude*.AppImage"):
-                    if appimage.is_file() and os.access(appimage, os.X_OK):
-                        claude_installed = True
-                        claude_locations.append(str(appimage))
-            
             # Config file locations for Linux
             possible_config_paths = [
-                self.home / ".config" / "Claude" / "claude_desktop_config.json",
-                self.home / ".config" / "claude" / "claude_desktop_config.json",
-                self.home / ".claude" / "claude_desktop_config.json",
+                join(home, ".config", "Claude", "claude_desktop_config.json"),
+                join(home, ".config", "claude", "claude_desktop_config.json"),
+                join(home, ".claude", "claude_desktop_config.json"),
                 # Flatpak config location
-                self.home / ".var" / "app" / "com.anthropic.claude" / "config" / "Claude" / "claude_desktop_config.json",
+                join(home, ".var", "app", "com.anthropic.claude", "config", "Claude", "claude_desktop_config.json"),
                 # Snap config location
-                self.home / "snap" / "claude" / "current" / ".config" / "Claude" / "claude_desktop_config.json",
+                join(home, "snap", "claude", "current", ".config", "Claude", "claude_desktop_config.json"),
                 # Additional fallback locations
-                self.home / ".local" / "share" / "Claude" / "claude_desktop_config.json",
-                self.home / ".local" / "config" / "Claude" / "claude_desktop_config.json",
+                join(home, ".local", "share", "Claude", "claude_desktop_config.json"),
+                join(home, ".local", "config", "Claude", "claude_desktop_config.json"),
             ]
-        
-        # Remove duplicates while preserving order
-        claude_locations = list(dict.fromkeys(claude_locations))
-        
-        return claude_installed, claude_locations, possible_config_paths
+            
+            app_paths = tuple((loc,) for loc in desktop_files + binary_locations)
+            path_binaries = ("claude", "Claude")
+            appimage_dirs = (join(home, "Downloads"),)
+        
+        return _ClaudeCandidates(
+            app_paths=app_paths,
+            config_paths=tuple(Path(p) for p in possible_config_paths),
+            path_binaries=path_binaries,
+            appimage_dirs=appimage_dirs,
+        )
+
+    def check_claude_desktop(self) -> Tuple[bool, List[str], List[Path]]:
+        """
+        Enhanced Claude Desktop detection
+        Returns: (is_installed, app_locations, config_paths)
+        """
+        candidates = self._candidate_paths
+        claude_locations = []
+        seen_locations = set()
+
+        def add_location(location: str):
+            # Keep the first occurrence of each location, in detection order
+            if location not in seen_locations:
+                seen_locations.add(location)
+                claude_locations.append(location)
+
+        # Candidates are stat'ed one by one on purpose: listing their parent
+        # directories reads every entry there and counts broken symlinks as installs
+        for group in candidates.app_paths:
+            for path in group:
+                if os.path.exists(path):
+                    add_location(path)
+                    break
+        
+        # Fall back to a PATH search only when no known location matched;
+        # shutil.which stats every PATH entry (for every PATHEXT suffix on Windows)
+        if not claude_locations:
+            for name in candidates.path_binaries:
+                claude_bin = shutil.which(name)
+                if claude_bin:
+                    add_location(claude_bin)
+                    break
+        
+        # AppImage check (single directory pass, file type comes from the dirent)
+        for downloads_dir in candidates.appimage_dirs:
+            try:
+                with os.scandir(downloads_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if ("laude" in name and name.endswith(".AppImage")
+                                and entry.is_file(follow_symlinks=False)
+                                and os.access(entry.path, os.X_OK)):
+                            add_location(entry.path)
+            except OSError:
+                pass
+        
+        return bool(claude_locations), claude_locations, list(candidates.config_paths)
 
     def find_claude_config_file(self, possible_paths: List[Path]) -> Optional[Path]:
         """
         Find the Claude Desktop config file from a list of possible paths
         Returns the first existing config file or the most likely location to create one
         """
-        # First, check if any config file already exists
+        # Check for an existing config file; along the way remember the first
+        # candidate whose directory exists (Claude has been run and created it),
+        # and stop probing parents once one is found
+        fallback = None
         for path in possible_paths:
             if path.exists():
                 print(f"{Colors.GREEN}✅ Found existing config: {path}{Colors.ENDC}")
                 return path
+            if fallback is None and path.parent.is_dir():
+                fallback = path
         
-        # If no config exists, find the first path where the parent directory exists
-        # (Claude has been run and created its config directory)
+        if fallback is not None:
+            print(f"{Colors.BLUE}📝 Will create config at: {fallback}{Colors.ENDC}")
+            return fallback
+        
+        # If no parent directories exist, create the directory structure for the
+        # most likely location, moving on to the next one if that is not allowed
         for path in possible_paths:
-            if path.parent.exists():
-                print(f"{Colors.BLUE}📝 Will create config at: {path}{Colors.ENDC}")
+            print(f"{Colors.YELLOW}📁 Creating config directory: {path.parent}{Colors.ENDC}")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
                 return path
-        
-        # If no parent directories exist, use the most likely default location
-        # and create the directory structure
-        default_path = possible_paths[0]
-        print(f"{Colors.YELLOW}📁 Creating config directory: {default_path.parent}{Colors.ENDC}")
-        try:
-            default_path.parent.mkdir(parents=True, exist_ok=True)
-            return default_path
-        except Exception as e:
-            print(f"{Colors.RED}❌ Could not create config directory: {e}{Colors.ENDC}")
-            return None
+            except OSError as e:
+                print(f"{Colors.RED}❌ Could not create config directory: {e}{Colors.ENDC}")
+        return None
 
     
     def safe_update_claude_config(self, config_file: Path, new_server_config: Dict) -> bool:
@@ -917,14 +1427,17 @@ API_TIMEOUT=30.0
                 shutil.copy2(config_file, backup_file)
                 print(f"{Colors.BLUE}📋 Created backup: {backup_file}{Colors.ENDC}")
                 
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    try:
-                        config = json.load(f)
-                        print(f"{Colors.GREEN}✅ Loaded existing config{Colors.ENDC}")
-                    except json.JSONDecodeError as e:
-                        print(f"{Colors.WARNING}⚠️ Invalid JSON in config file, creating new config{Colors.ENDC}")
-                        print(f"   Error: {e}")
-                        config = {}
+                # Hand the raw bytes to json.loads; it detects the UTF encoding
+                # itself, so there is no need for a decoding text wrapper
+                with open(config_file, 'rb') as f:
+                    raw = f.read()
+                try:
+                    config = json.loads(raw)
+                    print(f"{Colors.GREEN}✅ Loaded existing config{Colors.ENDC}")
+                except json.JSONDecodeError as e:
+                    print(f"{Colors.WARNING}⚠️ Invalid JSON in config file, creating new config{Colors.ENDC}")
+                    print(f"   Error: {e}")
+                    config = {}
             else:
                 print(f"{Colors.BLUE}📝 Creating new config file{Colors.ENDC}")
                 config = {}
@@ -965,12 +1478,15 @@ API_TIMEOUT=30.0
                         print(f"{Colors.GREEN}✅ Keeping existing configuration{Colors.ENDC}")
                         return True
                     elif choice == "3":
-                        # Save with different name
-                        alternative_name = "nasuni-management-new"
-                        counter = 1
-                        while f"{alternative_name}" in config["mcpServers"]:
-                            counter += 1
-                            alternative_name = f"nasuni-management-{counter}"
+                        # Save with the first free name: -new, then -2, -3, ...
+                        existing = set(config["mcpServers"])
+                        alternative_name = next(
+                            name for name in itertools.chain(
+                                ["nasuni-management-new"],
+                                (f"nasuni-management-{i}" for i in itertools.count(2))
+                            )
+                            if name not in existing
+                        )
                         
                         config["mcpServers"][alternative_name] = new_server_config
                         print(f"{Colors.GREEN}✅ Added as '{alternative_name}' (keeping both){Colors.ENDC}")
@@ -988,7 +1504,7 @@ API_TIMEOUT=30.0
                 print(f"{Colors.GREEN}✅ Added nasuni-management configuration{Colors.ENDC}")
             
             # Show summary of other configured servers
-            other_servers = [k for k in config["mcpServers"].keys() if k != "nasuni-management"]
+            other_servers = [k for k in config["mcpServers"] if k != "nasuni-management"]
             if other_servers:
                 print(f"{Colors.CYAN}ℹ️ Preserving {len(other_servers)} other MCP server(s):{Colors.ENDC}")
                 for server in other_servers[:5]:  # Show first 5
@@ -996,10 +1512,8 @@ API_TIMEOUT=30.0
                 if len(other_servers) > 5:
                     print(f"   ... and {len(other_servers) - 5} more")
             
-            # Write config with nice formatting
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-                f.write('\n')  # Add trailing newline for better git compatibility
+            # Write config with nice formatting; trailing newline for better git compatibility
+            _atomic_write(config_file, json.dumps(config, indent=2, ensure_ascii=False) + '\n')
             
             print(f"{Colors.GREEN}✅ Config updated successfully{Colors.ENDC}")
             return True
@@ -1018,7 +1532,10 @@ API_TIMEOUT=30.0
         print(f"\n{Colors.BLUE}🤖 Configuring Claude Desktop...{Colors.ENDC}")
         
         # Check if Claude Desktop is installed
-        claude_installed, claude_locations, possible_config_paths = self.check_claude_desktop()
+        if self.claude_probe is not None:
+            claude_installed, claude_locations, possible_config_paths = self.claude_probe.result()
+        else:
+            claude_installed, claude_locations, possible_config_paths = self.check_claude_desktop()
         
         if not claude_installed:
             print(f"{Colors.WARNING}⚠️ Claude Desktop not found on this system{Colors.ENDC}")
@@ -1032,11 +1549,12 @@ API_TIMEOUT=30.0
             self.create_configure_script()
             return False
         
-        print(f"{Colors.GREEN}✅ Claude Desktop found at {len(claude_locations)} location(s){Colors.ENDC}")
+        lines = [f"{Colors.GREEN}✅ Claude Desktop found at {len(claude_locations)} location(s){Colors.ENDC}"]
         for i, loc in enumerate(claude_locations[:3], 1):  # Show first 3 locations
-            print(f"   {i}. {loc}")
+            lines.append(f"   {i}. {loc}")
         if len(claude_locations) > 3:
-            print(f"   ... and {len(claude_locations) - 3} more")
+            lines.append(f"   ... and {len(claude_locations) - 3} more")
+        print("\n".join(lines))
         
         # Find the config file
         config_file = self.find_claude_config_file(possible_config_paths)
@@ -1077,15 +1595,16 @@ API_TIMEOUT=30.0
         success = self.safe_update_claude_config(config_file, new_server_config)
         
         if success:
-            print(f"\n{Colors.GREEN}✅ Claude Desktop configured successfully!{Colors.ENDC}")
-            print(f"   Config file: {config_file}")
-            print(f"\n{Colors.HEADER}Next steps:{Colors.ENDC}")
-            print(f"1. {Colors.BOLD}Restart Claude Desktop{Colors.ENDC}")
-            print(f"2. Look for 'nasuni-management-mcp-server' in the MCP tools menu")
-            print(f"3. Test by asking: 'List all my filers'")
+            print("\n".join([
+                f"\n{Colors.GREEN}✅ Claude Desktop configured successfully!{Colors.ENDC}",
+                f"   Config file: {config_file}",
+                f"\n{Colors.HEADER}Next steps:{Colors.ENDC}",
+                f"1. {Colors.BOLD}Restart Claude Desktop{Colors.ENDC}",
+                "2. Look for 'nasuni-management-mcp-server' in the MCP tools menu",
+                "3. Test by asking: 'List all my filers'",
+            ]))
 
-            global claude_configured 
-            claude_configured = True
+            self.claude_configured = True
 
             return True
         else:
@@ -1099,233 +1618,69 @@ API_TIMEOUT=30.0
         """Create an enhanced standalone script to configure Claude Desktop later"""
         configure_script = self.install_dir / "configure_claude.py"
         
-        script_content = f'''#!/usr/bin/env python3
-    """
-    Standalone script to configure Claude Desktop for Nasuni Management MCP Server
-    Run this after installing Claude Desktop
-    Enhanced version with better detection and safe config updates
-    """
-
-    import json
-    import sys
-    import shutil
-    import platform
-    from pathlib import Path
-    from typing import Optional, List, Dict, Tuple
-
-    def find_claude_desktop() -> Tuple[bool, List[str]]:
-        """Find Claude Desktop installation"""
-        os_type = platform.system()
-        home = Path.home()
-        claude_installed = False
-        claude_locations = []
-        
-        if os_type == "Darwin":  # macOS
-            app_locations = [
-                Path("/Applications/Claude.app"),
-                home / "Applications" / "Claude.app",
-                Path("/System/Applications/Claude.app"),
-                Path("/Applications/Setapp/Claude.app"),
-            ]
-            for loc in app_locations:
-                if loc.exists():
-                    claude_installed = True
-                    claude_locations.append(str(loc))
-                    
-        elif os_type == "Windows":
-            import os
-            program_locations = []
-            if os.environ.get("PROGRAMFILES"):
-                program_locations.append(Path(os.environ["PROGRAMFILES"]) / "Claude")
-            if os.environ.get("LOCALAPPDATA"):
-                program_locations.append(Path(os.environ["LOCALAPPDATA"]) / "Claude")
-                program_locations.append(Path(os.environ["LOCALAPPDATA"]) / "Programs" / "Claude")
-            
-            for base in program_locations:
-                if base.exists():
-                    for exe_name in ["Claude.exe", "claude.exe"]:
-                        if (base / exe_name).exists():
-                            claude_installed = True
-                            claude_locations.append(str(base / exe_name))
-                            
-        else:  # Linux
-            binary_locations = [
-                "/usr/bin/claude",
-                "/usr/local/bin/claude",
-                "/opt/claude/claude",
-                str(home / ".local" / "bin" / "claude"),
-            ]
-            for path in binary_locations:
-                if Path(path).exists():
-                    claude_installed = True
-                    claude_locations.append(path)
-        
-        return claude_installed, claude_locations
-
-    def get_config_paths() -> List[Path]:
-        """Get possible config file paths"""
-        os_type = platform.system()
-        home = Path.home()
-        
-        if os_type == "Darwin":
-            return [
-                home / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json",
-                home / ".claude" / "claude_desktop_config.json",
-            ]
-        elif os_type == "Windows":
-            import os
-            return [
-                Path(os.environ.get("APPDATA", home / "AppData" / "Roaming")) / "Claude" / "claude_desktop_config.json",
-                Path(os.environ.get("LOCALAPPDATA", home / "AppData" / "Local")) / "Claude" / "claude_desktop_config.json",
-            ]
-        else:
-            return [
-                home / ".config" / "Claude" / "claude_desktop_config.json",
-                home / ".config" / "claude" / "claude_desktop_config.json",
-                home / ".claude" / "claude_desktop_config.json",
-            ]
-
-    def configure_claude():
-        python_cmd = "{self.python_cmd}"
-        main_py = "{self.install_dir / 'main.py'}"
-        cwd = "{self.install_dir}"
-        
-        # Check if Claude is installed
-        installed, locations = find_claude_desktop()
-        if not installed:
-            print("❌ Claude Desktop not found")
-            print("Please install from: https://claude.ai/download")
-            return False
-        
-        print(f"✅ Claude Desktop found")
-        
-        # Find config file
-        config_paths = get_config_paths()
-        config_file = None
-        
-        for path in config_paths:
-            if path.exists():
-                config_file = path
-                print(f"✅ Found config: {{path}}")
-                break
-            elif path.parent.exists():
-                config_file = path
-                print(f"📝 Will create config at: {{path}}")
-                break
-        
-        if not config_file:
-            # Create directory for first option
-            config_file = config_paths[0]
-            config_file.parent.mkdir(parents=True, exist_ok=True)
-            print(f"📁 Created config directory: {{config_file.parent}}")
-        
-        # Load or create config
-        if config_file.exists():
-            # Backup existing config
-            backup = config_file.with_suffix('.json.backup')
-            shutil.copy2(config_file, backup)
-            print(f"📋 Backed up to: {{backup}}")
-            
-            with open(config_file, 'r', encoding='utf-8') as f:
-                try:
-                    config = json.load(f)
-                except:
-                    print("⚠️ Invalid JSON, creating new config")
-                    config = {{}}
-        else:
-            config = {{}}
-        
-        # Add MCP server (preserving existing servers)
-        if "mcpServers" not in config:
-            config["mcpServers"] = {{}}
-        
-        # Show existing servers
-        existing = [k for k in config["mcpServers"].keys() if k != "nasuni-management"]
-        if existing:
-            print(f"ℹ️ Preserving {{len(existing)}} existing MCP server(s)")
-        
-        config["mcpServers"]["nasuni-management"] = {{
-            "command": python_cmd,
-            "args": [main_py],
-            "cwd": cwd
-        }}
-        
-        # Save config
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
-            f.write('\\n')
-        
-        print("✅ Claude Desktop configured successfully!")
-        print(f"   Config: {{config_file}}")
-        print("\\n🚀 Please restart Claude Desktop to use Nasuni Management MCP tools")
-        return True
-
-    if __name__ == "__main__":
-        try:
-            success = configure_claude()
-            sys.exit(0 if success else 1)
-        except Exception as e:
-            print(f"❌ Error: {{e}}")
-            sys.exit(1)
-    '''
+        script_content = _CONFIGURE_SCRIPT_TEMPLATE % (
+            self.python_cmd, str(self.install_dir / 'main.py'), str(self.install_dir)
+        )
         
         try:
-            configure_script.write_text(script_content, encoding="utf-8")
-            if self.os_type != "Windows":
-                configure_script.chmod(0o755)
+            _atomic_write(configure_script, script_content, 0o644 if _IS_WINDOWS else 0o755)
             print(f"{Colors.GREEN}✅ Created configuration script: {configure_script}{Colors.ENDC}")
         except Exception as e:
             print(f"{Colors.RED}❌ Failed to create configure script: {e}{Colors.ENDC}")
 
-    def print_manual_config(self):
-        """Print manual configuration instructions with better formatting"""
+    @functools.cached_property
+    def _manual_cfg(self) -> Tuple[str, str]:
+        """Rendered server entry and full config file for manual setup"""
         main_py = self.install_dir / "main.py"
-        
-        config_json = {
-            "mcpServers": {
-                "nasuni-management": {
-                    "command": self.python_cmd,
-                    "args": [str(main_py)],
-                    "cwd": str(self.install_dir)
-                }
-            }
+        entry = {
+            "command": self.python_cmd,
+            "args": [str(main_py)],
+            "cwd": str(self.install_dir)
         }
-        
-        print(f"\n{Colors.CYAN}{'='*60}{Colors.ENDC}")
-        print(f"{Colors.HEADER}Manual Configuration for claude_desktop_config.json:{Colors.ENDC}")
-        print(f"{Colors.CYAN}{'='*60}{Colors.ENDC}")
-        print("\nAdd this to your existing mcpServers section:")
-        print(f"{Colors.YELLOW}")
-        print(json.dumps(config_json["mcpServers"]["nasuni-management"], indent=2))
-        print(f"{Colors.ENDC}")
-        print(f"\nOr if you have no existing config, use this complete file:")
-        print(f"{Colors.YELLOW}")
-        print(json.dumps(config_json, indent=2))
-        print(f"{Colors.ENDC}")
-        print(f"{Colors.CYAN}{'='*60}{Colors.ENDC}")
-        
-        # Show common config locations
-        print(f"\n{Colors.HEADER}Common config file locations:{Colors.ENDC}")
+        config_json = {"mcpServers": {"nasuni-management": entry}}
+        return json.dumps(entry, indent=2), json.dumps(config_json, indent=2)
+
+    def print_manual_config(self):
+        """Print manual configuration instructions with better formatting"""
+        entry_json, config_json = self._manual_cfg
+        
+        lines = [
+            f"\n{Colors.CYAN}{'='*60}{Colors.ENDC}",
+            f"{Colors.HEADER}Manual Configuration for claude_desktop_config.json:{Colors.ENDC}",
+            f"{Colors.CYAN}{'='*60}{Colors.ENDC}",
+            "\nAdd this to your existing mcpServers section:",
+            Colors.YELLOW,
+            entry_json,
+            Colors.ENDC,
+            "\nOr if you have no existing config, use this complete file:",
+            Colors.YELLOW,
+            config_json,
+            Colors.ENDC,
+            f"{Colors.CYAN}{'='*60}{Colors.ENDC}",
+            # Show common config locations
+            f"\n{Colors.HEADER}Common config file locations:{Colors.ENDC}",
+        ]
         if self.os_type == "Darwin":
-            print(f"  • macOS: ~/Library/Application Support/Claude/claude_desktop_config.json")
-        elif self.os_type == "Windows":
-            print(f"  • Windows: %APPDATA%\\Claude\\claude_desktop_config.json")
-            print(f"            (Usually: C:\\Users\\{{username}}\\AppData\\Roaming\\Claude\\)")
+            lines.append("  • macOS: ~/Library/Application Support/Claude/claude_desktop_config.json")
+        elif _IS_WINDOWS:
+            lines.append("  • Windows: %APPDATA%\\Claude\\claude_desktop_config.json")
+            lines.append("            (Usually: C:\\Users\\{username}\\AppData\\Roaming\\Claude\\)")
         else:
-            print(f"  • Linux: ~/.config/Claude/claude_desktop_config.json")
+            lines.append("  • Linux: ~/.config/Claude/claude_desktop_config.json")
+        _write_block(lines)
 
 
     def create_shortcuts(self):
         """Create convenient shortcuts/commands"""
         print(f"\n{Colors.BLUE}🔗 Creating shortcuts...{Colors.ENDC}")
         
-        if self.os_type == "Windows":
+        if _IS_WINDOWS:
             # Create batch file
             batch_file = self.install_dir / "nasuni-management-mcp.bat"
             batch_content = f'''@echo off
 "{self.python_cmd}" "{self.install_dir}\\main.py" %*
 '''
-            batch_file.write_text(batch_content)
+            _atomic_write(batch_file, batch_content)
             print(f"  Created: {batch_file}")
             
         else:
@@ -1334,51 +1689,68 @@ API_TIMEOUT=30.0
             shell_content = f'''#!/bin/bash
 {self.python_cmd} {self.install_dir}/main.py "$@"
 '''
-            shell_file.write_text(shell_content)
-            shell_file.chmod(0o755)
+            # Created executable up front instead of write + chmod
+            _atomic_write(shell_file, shell_content, 0o755)
             print(f"  Created: {shell_file}")
     
     def print_success(self):
         """Print success message and next steps"""
-        print(f"\n{Colors.GREEN}{'='*60}{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.GREEN}✨ Installation Complete!{Colors.ENDC}")
-        print(f"{Colors.GREEN}{'='*60}{Colors.ENDC}\n")
-        
-        print(f"{Colors.HEADER}📍 Installation Details:{Colors.ENDC}")
-        print(f"  • Location: {self.install_dir}")
-        print(f"  • Python: {self.python_cmd}")
-        print(f"  • NMC URL: {self.config.get('url', 'configured')}")
+        # Claude Desktop status as recorded by configure_claude_desktop
+        claude_installed = self.claude_configured
+        
+        lines = [
+            f"\n{Colors.GREEN}{'='*60}{Colors.ENDC}",
+            f"{Colors.BOLD}{Colors.GREEN}✨ Installation Complete!{Colors.ENDC}",
+            f"{Colors.GREEN}{'='*60}{Colors.ENDC}\n",
+            f"{Colors.HEADER}📍 Installation Details:{Colors.ENDC}",
+            f"  • Location: {self.install_dir}",
+            f"  • Python: {self.python_cmd}",
+            f"  • NMC URL: {self.config.get('url', 'configured')}",
+        ]
         
-        # Check Claude Desktop status
-        #claude_installed, _ = self.check_claude_desktop()
-        claude_installed= claude_configured
-
         if claude_installed:
-            print(f"\n{Colors.HEADER}🚀 Next Steps:{Colors.ENDC}")
-            print(f"  1. {Colors.BOLD}Restart Claude Desktop{Colors.ENDC}")
-            print(f"  2. Look for 'nasuni-management-mcp-server' in Claude's tools menu")
-            print(f"  3. Try asking Claude: 'List all my filers'")
+            lines += [
+                f"\n{Colors.HEADER}🚀 Next Steps:{Colors.ENDC}",
+                f"  1. {Colors.BOLD}Restart Claude Desktop{Colors.ENDC}",
+                f"  2. Look for 'nasuni-management-mcp-server' in Claude's tools menu",
+                f"  3. Try asking Claude: 'List all my filers'",
+            ]
         else:
-            print(f"\n{Colors.WARNING}⚠️  Claude Desktop Not Installed{Colors.ENDC}")
-            print(f"\n{Colors.HEADER}📥 To Complete Setup:{Colors.ENDC}")
-            print(f"  1. Download Claude Desktop: {Colors.CYAN}https://claude.ai/download{Colors.ENDC}")
-            print(f"  2. Install and run Claude Desktop once")
-            print(f"  3. Run: {Colors.GREEN}{self.python_cmd} {self.install_dir}/configure_claude.py{Colors.ENDC}")
-            print(f"\n{Colors.BLUE}The Nasuni Management MCP Server is ready and waiting for Claude Desktop{Colors.ENDC}")
+            lines += [
+                f"\n{Colors.WARNING}⚠️  Claude Desktop Not Installed{Colors.ENDC}",
+                f"\n{Colors.HEADER}📥 To Complete Setup:{Colors.ENDC}",
+                f"  1. Download Claude Desktop: {Colors.CYAN}https://claude.ai/download{Colors.ENDC}",
+                f"  2. Install and run Claude Desktop once",
+                f"  3. Run: {Colors.GREEN}{self.python_cmd} {self.install_dir}/configure_claude.py{Colors.ENDC}",
+                f"\n{Colors.BLUE}The Nasuni Management MCP Server is ready and waiting for Claude Desktop{Colors.ENDC}",
+            ]
         
-        print(f"\n{Colors.HEADER}📚 Useful Commands:{Colors.ENDC}")
-        print(f"  • Test connection: {self.python_cmd} {self.install_dir}/main.py")
-        print(f"  • Update config: Edit {self.install_dir}/.env")
+        lines += [
+            f"\n{Colors.HEADER}📚 Useful Commands:{Colors.ENDC}",
+            f"  • Test connection: {self.python_cmd} {self.install_dir}/main.py",
+            f"  • Update config: Edit {self.install_dir}/.env",
+        ]
         if not claude_installed:
-            print(f"  • Configure Claude: {self.python_cmd} {self.install_dir}/configure_claude.py")
+            lines.append(f"  • Configure Claude: {self.python_cmd} {self.install_dir}/configure_claude.py")
+        
+        lines.append(f"\n{Colors.CYAN}Need help? Visit: {GITHUB_REPO}{Colors.ENDC}")
         
-        print(f"\n{Colors.CYAN}Need help? Visit: {GITHUB_REPO}{Colors.ENDC}")
+        # One write for the whole banner so slow consoles don't tear it mid-way
+        _write_block(lines)
     
     def run(self):
         """Run the complete installation process"""
         try:
             self.print_header()
             
+            # Neither the GitHub lookups nor Claude Desktop detection depend on
+            # anything the user is about to type, so run them during the prompts
+            background = ThreadPoolExecutor(max_workers=2)
+            self.archive_lookup = background.submit(self._resolve_archive, True)
+            if not self.args.skip_claude:
+                self.claude_probe = background.submit(self.check_claude_desktop)
+            background.shutdown(wait=False)
+            
             # Step 1: Check Python
             if not self.check_python():
                 print(f"\n{Colors.RED}Please install Python 3.10+ and run this installer again{Colors.ENDC}")
@@ -1401,19 +1773,23 @@ API_TIMEOUT=30.0
                 self.test_connection()  # Optional, don't fail if it doesn't work
             
             # Step 6: Configure Claude Desktop (skip if requested)
-            # Get confirmation before proceeding with setup
-            proceed_with_claude_setup = input(f"{Colors.YELLOW}Continue with Claude Setup? (y/n): {Colors.ENDC}").lower()
-            
-            if proceed_with_claude_setup  != 'y': 
-                print(f"\n{Colors.YELLOW}Skipped Claude Setup{Colors.ENDC}")
-                return True
-
-            if not self.args.skip_claude and proceed_with_claude_setup == 'y':
+            if not self.args.skip_claude:
+                # Get confirmation before proceeding with setup; unattended installs proceed
+                if not self.args.non_interactive:
+                    answer = input(f"{Colors.YELLOW}Continue with Claude Setup? (y/n): {Colors.ENDC}")
+                    if answer.strip().lower() != 'y':
+                        print(f"\n{Colors.YELLOW}Skipped Claude Setup{Colors.ENDC}")
+                        return True
+                
                 self.configure_claude_desktop()
             
             # Step 7: Create shortcuts
             self.create_shortcuts()
             
+            # Don't report success while dependency bytecode is still being written
+            if self.bytecode_job is not None:
+                self.bytecode_job.wait()
+            
             # Success!
             self.print_success()
             return True
@@ -1426,6 +1802,10 @@ API_TIMEOUT=30.0
             import traceback
             traceback.print_exc()
             return False
+        finally:
+            # Early returns too: exiting mid-compile would leave the venv's bytecode half written
+            if self.bytecode_job is not None:
+                self.bytecode_job.wait()
 
 def main():
     """Main entry point"""
@@ -1445,21 +1825,26 @@ def main():
     
     args = parser.parse_args()
     
-    # On Windows, default to quiet mode to prevent crashes
-    if platform.system() == "Windows" and not args.quiet:
-        print("Note: Running in reduced output mode on Windows to prevent console issues.")
-        print("Use --verbose flag if you want detailed output.\n")
-        args.quiet = True
-    
     # Validate that if credentials are provided, all are provided
     if any([args.nmc_url, args.username, args.password]):
         if not all([args.nmc_url, args.username, args.password]):
             print(f"Error: If providing credentials, you must provide --nmc-url, --username, and --password")
             sys.exit(1)
     
+    # On Windows, default to quiet mode to prevent crashes
+    if _IS_WINDOWS and not args.quiet:
+        print("Note: Running in reduced output mode on Windows to prevent console issues.")
+        print("Use --verbose flag if you want detailed output.\n")
+        args.quiet = True
+
+    # Quiet Windows consoles get plain text; skip formatting escapes nobody sees
+    if _IS_WINDOWS and args.quiet:
+        Colors.disable()
+    
     installer = Installer(args)
     success = installer.run()
-    input(f"{Colors.YELLOW}Hit enter to exit: {Colors.ENDC}")
+    if not args.non_interactive:
+        input(f"{Colors.YELLOW}Hit enter to exit: {Colors.ENDC}")
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
@@ -2,12 +2,8 @@
 """Enhanced main entry point with better error handling and diagnostics."""
 
 import asyncio
+import importlib
 import sys
-from mcp.server.stdio import stdio_server
-from api.auth_api import AuthAPIClient
-from server.mcp_server import MCPServer
-from api.filers_api import FilersAPIClient
-from api.volumes_api import VolumesAPIClient
 from config.settings import config
 from config.logging_setup import setup_logging, get_logger
 
@@ -18,6 +14,10 @@ async def main():
     print("🚀 Starting NMC MCP server...", file=sys.stderr)
     setup_logging()
 
+    # Imported here so CLI subcommands don't pay for the MCP stack at startup
+    from mcp.server.stdio import stdio_server
+    from server.mcp_server import MCPServer
+
     logger.debug("check")
     try:
         # Create and configure the server
@@ -43,248 +43,59 @@ async def main():
         raise
 
 
-async def diagnose_system():
-    """Comprehensive system diagnosis."""
-    print("🔍 SYSTEM DIAGNOSIS", file=sys.stderr)
-    print("=" * 50, file=sys.stderr)
-    
-    # 1. Configuration check
-    print("📋 Configuration Check:", file=sys.stderr)
-    try:
-        print(f"   Filers API URL: {config.filers_config.base_url}", file=sys.stderr)
-        print(f"   API Token: {'✅ Present' if config.filers_config.token else '❌ Missing'}", file=sys.stderr)
-        print(f"   SSL Verification: {config.filers_config.verify_ssl}", file=sys.stderr)
-        print(f"   Timeout: {config.filers_config.timeout}s", file=sys.stderr)
-        
-        # Check if shares and volumes configs exist
-        if hasattr(config, 'shares_config'):
-            print("   Shares Config: ✅ Available", file=sys.stderr)
-        else:
-            print("   Shares Config: ❌ Missing", file=sys.stderr)
-            
-        if hasattr(config, 'volumes_config'):
-            print("   Volumes Config: ✅ Available", file=sys.stderr)
-        else:
-            print("   Volumes Config: ❌ Missing", file=sys.stderr)
-            
-    except Exception as e:
-        print(f"   ❌ Configuration error: {e}", file=sys.stderr)
-    
-    # 2. API connectivity test
-    print("\n🌐 API Connectivity:", file=sys.stderr)
-    
-    # Test Filers API
-    try:
-        filers_client = FilersAPIClient(config.filers_config)
-        filers_success = await filers_client.test_connection()
-        if filers_success:
-            print("   Filers API: ✅ Connected", file=sys.stderr)
-            try:
-                stats = await filers_client.get_filer_statistics()
-                print(f"   Filers Found: {stats.get('total', 0)}", file=sys.stderr)
-            except Exception as e:
-                print(f"   Filers Data: ❌ {e}", file=sys.stderr)
-        else:
-            print("   Filers API: ❌ Connection failed", file=sys.stderr)
-    except Exception as e:
-        print(f"   Filers API: ❌ {e}", file=sys.stderr)
-    
-    # Test Volumes API
-    try:
-        volumes_client = VolumesAPIClient(config.filers_config)  # Assuming same config
-        volumes_success = await volumes_client.test_connection()
-        if volumes_success:
-            print("   Volumes API: ✅ Connected", file=sys.stderr)
-            try:
-                stats = await volumes_client.get_volume_statistics()
-                print(f"   Volumes Found: {stats.get('total', 0)}", file=sys.stderr)
-            except Exception as e:
-                print(f"   Volumes Data: ❌ {e}", file=sys.stderr)
-        else:
-            print("   Volumes API: ❌ Connection failed", file=sys.stderr)
-    except Exception as e:
-        print(f"   Volumes API: ❌ {e}", file=sys.stderr)
-    
-    # 3. Tool registration test
-    print("\n🛠️  Tool Registration:", file=sys.stderr)
-    try:
-        mcp_server = MCPServer("nmc-diagnosis-server")
-        tools = mcp_server.tool_registry.get_tool_names()
-        print(f"   Total Tools: {len(tools)}", file=sys.stderr)
-        for tool in tools:
-            print(f"   - {tool}", file=sys.stderr)
-    except Exception as e:
-        print(f"   ❌ Tool registration error: {e}", file=sys.stderr)
-    
-    print("\n" + "=" * 50, file=sys.stderr)
-    print("🏁 Diagnosis Complete", file=sys.stderr)
+async def refresh_token(force: bool = True):
+    """Get a new NMC API token, or keep the current one if it is still valid."""
+    from api.auth_api import AuthAPIClient
 
-
-    # Add to the diagnose_system function in main.py
-
-    # Test Cloud Credentials API
-    try:
-        from api.cloud_credentials_api import CloudCredentialsAPIClient
-        cloud_creds_client = CloudCredentialsAPIClient(config.filers_config)
-        creds_success = await cloud_creds_client.test_connection()
-        if creds_success:
-            print("   Cloud Credentials API: ✅ Connected", file=sys.stderr)
-            try:
-                stats = await cloud_creds_client.get_credential_statistics()
-                print(f"   Credentials Found: {stats.get('total_deployments', 0)} deployments", file=sys.stderr)
-                print(f"   Unique Credentials: {stats.get('unique_credentials', 0)}", file=sys.stderr)
-                print(f"   In Use: {stats.get('in_use', 0)}", file=sys.stderr)
-            except Exception as e:
-                print(f"   Credentials Data: ❌ {e}", file=sys.stderr)
-        else:
-            print("   Cloud Credentials API: ❌ Connection failed", file=sys.stderr)
-    except Exception as e:
-        print(f"   Cloud Credentials API: ❌ {e}", file=sys.stderr)
+    auth_client = AuthAPIClient(config.filers_config)
+    if force:
+        await auth_client.login()
+    else:
+        await auth_client.ensure_valid_token()
 
 
-async def test_all_tools():
-    """Test all registered tools."""
-    print("🧪 TESTING ALL TOOLS", file=sys.stderr)
-    print("=" * 50, file=sys.stderr)
-    
-    try:
-        mcp_server = MCPServer("nmc-test-server")
-        tools = mcp_server.tool_registry.get_tool_names()
-        
-        print(f"📋 Testing {len(tools)} tools...", file=sys.stderr)
-        
-        test_results = {}
-        
-        for tool_name in tools:
-            print(f"\n🔧 Testing: {tool_name}", file=sys.stderr)
-            try:
-                # Test with minimal/empty arguments
-                result = await mcp_server.tool_registry.execute_tool(tool_name, {})
-                
-                if result and len(result) > 0:
-                    text_length = len(result[0].text) if hasattr(result[0], 'text') else 0
-                    if "❌ Error:" in result[0].text:
-                        test_results[tool_name] = "❌ Error"
-                        print(f"   Result: ❌ Error in response", file=sys.stderr)
-                    else:
-                        test_results[tool_name] = "✅ Success"
-                        print(f"   Result: ✅ Success ({text_length} chars)", file=sys.stderr)
-                else:
-                    test_results[tool_name] = "⚠️ Empty"
-                    print(f"   Result: ⚠️ Empty response", file=sys.stderr)
-                    
-            except Exception as e:
-                test_results[tool_name] = f"❌ {str(e)}"
-                print(f"   Result: ❌ Exception: {e}", file=sys.stderr)
-        
-        # Summary
-        print(f"\n📊 TEST SUMMARY", file=sys.stderr)
-        print("=" * 30, file=sys.stderr)
-        
-        success_count = sum(1 for result in test_results.values() if result == "✅ Success")
-        error_count = sum(1 for result in test_results.values() if "❌" in result)
-        
-        print(f"✅ Successful: {success_count}/{len(tools)}", file=sys.stderr)
-        print(f"❌ Failed: {error_count}/{len(tools)}", file=sys.stderr)
-        
-        if error_count > 0:
-            print("\n❌ Failed Tools:", file=sys.stderr)
-            for tool_name, result in test_results.items():
-                if "❌" in result:
-                    print(f"   - {tool_name}: {result}", file=sys.stderr)
-        
-    except Exception as e:
-        print(f"❌ Tool testing failed: {e}", file=sys.stderr)
+# Subcommand -> (module, coroutine function); the module is imported only
+# when its command runs
+LAZY_COMMANDS = {
+    "diagnose": ("cli.diagnose", "diagnose_system"),
+    "test-tools": ("cli.test_tools", "test_all_tools"),
+    "test-api": ("cli.test_api", "quick_share_test"),
+}
 
 
-async def quick_share_test():
-    """Quick test of shares functionality."""
-    print("Quick Share Test\n", file=sys.stderr)
-    
-    try:
-        # Test 1: Can we import the shares API?
-        print("1. Testing shares API import...", file=sys.stderr)
-        from api.shares_api import SharesAPIClient
-        print("   ✅ SharesAPIClient imported", file=sys.stderr)
-        
-        # Test 2: Can we connect to the API?
-        print("\n2. Testing API connection...", file=sys.stderr)
-        client = SharesAPIClient(config.filers_config)
-        response = await client.list_shares()
-        
-        if "error" in response:
-            print(f"   ❌ API Error: {response['error']}", file=sys.stderr)
-            return
-        
-        items = response.get("items", [])
-        print(f"   ✅ Connected! Found {len(items)} shares", file=sys.stderr)
-        
-        # Test 3: Show sample share data
-        if items:
-            print("\n3. Sample share data:", file=sys.stderr)
-            first = items[0]
-            print(f"   Name: {first.get('share_name')}", file=sys.stderr)
-            print(f"   Path: {first.get('path')}", file=sys.stderr)
-            print(f"   Filer: {first.get('filer_serial_number')[:8]}...", file=sys.stderr)
-            print(f"   Previous Versions: {first.get('enable_previous_vers', 'N/A')}", file=sys.stderr)
-            print(f"   Fruit Enabled: {first.get('fruit_enabled', 'N/A')}", file=sys.stderr)
-        
-        # Test 4: Try to import share tools one by one
-        print("\n4. Testing tool imports:", file=sys.stderr)
-        
-        tools_to_test = [
-            "ListSharesTool",
-            "GetShareStatsTool", 
-            "GetSharesByFilerTool",
-            "GetBrowserAccessibleSharesTool",
-            "GetSharesByVolumeTool"
-        ]
-        
-        working_tools = []
-        for tool_name in tools_to_test:
-            try:
-                exec(f"from tools.share_tools import {tool_name}")
-                print(f"   ✅ {tool_name}", file=sys.stderr)
-                working_tools.append(tool_name)
-            except ImportError as e:
-                print(f"   ❌ {tool_name}: {e}", file=sys.stderr)
-        
-        print(f"\n✅ Summary: {len(working_tools)}/{len(tools_to_test)} tools working", file=sys.stderr)
-        print(f"   Working tools: {', '.join(working_tools)}", file=sys.stderr)
-        
-    except ImportError as e:
-        print(f"❌ Import failed: {e}", file=sys.stderr)
-    except Exception as e:
-        print(f"❌ Test failed: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc(file=sys.stderr)
+def run_command(command: str):
+    """Import and run a single CLI subcommand."""
+    module_name, func_name = LAZY_COMMANDS[command]
+    module = importlib.import_module(module_name)
+    asyncio.run(getattr(module, func_name)())
 
 
 if __name__ == "__main__":
 
-    #Getting a new NMC API Token
-    auth_client = AuthAPIClient(config.filers_config)
-    asyncio.run(auth_client.login())
-
     if len(sys.argv) > 1:
         command = sys.argv[1]
+
+        # CLI checks only need a token that is still valid; unknown commands
+        # just print usage and never touch the NMC
+        if command in LAZY_COMMANDS or command == "test":
+            asyncio.run(refresh_token(force=False))
         
         if command == "diagnose":
             print("🔍 Running system diagnosis...", file=sys.stderr)
-            asyncio.run(diagnose_system())
+            run_command("diagnose")
             
         elif command == "test-tools":
             print("🧪 Running tool tests...", file=sys.stderr)
-            asyncio.run(test_all_tools())
+            run_command("test-tools")
             
         elif command == "test-api":
             print("🌐 Running API test...", file=sys.stderr)
-            asyncio.run(quick_share_test())  # Your existing function
+            run_command("test-api")
             
         elif command == "test":
             print("🔄 Running all tests...", file=sys.stderr)
-            asyncio.run(diagnose_system())
-            asyncio.run(test_all_tools())
+            run_command("diagnose")
+            run_command("test-tools")
             
         else:
             print(f"❌ Unknown command: {command}", file=sys.stderr)
@@ -294,5 +105,8 @@ if __name__ == "__main__":
             print("  test-tools  - Test all registered tools", file=sys.stderr)
             print("  test        - Run all tests", file=sys.stderr)
     else:
+        #Getting a new NMC API Token
+        asyncio.run(refresh_token())
+
         print("🚀 MCP Server starting up...", file=sys.stderr)
-        asyncio.run(main())
\ No newline at end of file
+        asyncio.run(main())
@@ -8,6 +8,12 @@ from models.base import BaseModel
 class CloudCredential(BaseModel):
     """Cloud credential model."""
     
+    __fields__ = (
+        "cred_uuid", "name", "filer_serial_number", "cloud_provider", "account",
+        "hostname", "status", "secret", "note", "in_use", "skip_validation", "links",
+    )
+    __slots__ = __fields__ + ("_is_synced", "_is_aws", "_is_azure", "_is_gcp", "_masked_account")
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.cred_uuid = data.get("cred_uuid", "")
         self.name = data.get("name", "")
@@ -21,33 +27,40 @@ class CloudCredential(BaseModel):
         self.in_use = data.get("in_use", False)
         self.skip_validation = data.get("skip_validation", False)
         self.links = data.get("links", {})
+        
+        # Derived flags are computed once here rather than on every access
+        provider = self.cloud_provider.lower()
+        self._is_aws = "s3" in provider or "aws" in provider
+        self._is_azure = "azure" in provider
+        self._is_gcp = "google" in provider or "gcp" in provider
+        self._is_synced = self.status.lower() == "synced"
+        account = self.account
+        self._masked_account = f"{account[:4]}...{account[-4:]}" if len(account) > 8 else account
     
     @property
     def is_synced(self) -> bool:
         """Check if credential is synced."""
-        return self.status.lower() == "synced"
+        return self._is_synced
     
     @property
     def is_aws(self) -> bool:
         """Check if this is an AWS credential."""
-        return "s3" in self.cloud_provider.lower() or "aws" in self.cloud_provider.lower()
+        return self._is_aws
     
     @property
     def is_azure(self) -> bool:
         """Check if this is an Azure credential."""
-        return "azure" in self.cloud_provider.lower()
+        return self._is_azure
     
     @property
     def is_gcp(self) -> bool:
         """Check if this is a Google Cloud credential."""
-        return "google" in self.cloud_provider.lower() or "gcp" in self.cloud_provider.lower()
+        return self._is_gcp
     
     @property
     def masked_account(self) -> str:
         """Get masked account identifier."""
-        if len(self.account) > 8:
-            return f"{self.account[:4]}...{self.account[-4:]}"
-        return self.account
+        return self._masked_account
     
     def get_summary_dict(self) -> Dict[str, Any]:
         """Get a summary dictionary with key information."""
@@ -57,14 +70,14 @@ class CloudCredential(BaseModel):
             "filer_serial_number": self.filer_serial_number,
             "cloud_provider": self.cloud_provider,
             "account": self.account,
-            "masked_account": self.masked_account,
+            "masked_account": self._masked_account,
             "hostname": self.hostname,
             "status": self.status,
-            "is_synced": self.is_synced,
+            "is_synced": self._is_synced,
             "in_use": self.in_use,
             "note": self.note,
             "skip_validation": self.skip_validation,
-            "is_aws": self.is_aws,
-            "is_azure": self.is_azure,
-            "is_gcp": self.is_gcp,
+            "is_aws": self._is_aws,
+            "is_azure": self._is_azure,
+            "is_gcp": self._is_gcp,
         }
\ No newline at end of file
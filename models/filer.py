@@ -2,12 +2,17 @@
 """Filer-related data models."""
 
 from typing import Dict, Any, List
-from models.base import BaseModel, NestedModel
+from models.base import BaseModel, NestedModel, cached_slot
+
+BYTES_PER_GB = 1024 ** 3
 
 
 class AlertThresholds(NestedModel):
     """Alert threshold settings."""
     
+    __fields__ = ("snapshot_alert_settings",)
+    __slots__ = __fields__
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.snapshot_alert_settings = data.get("snapshot_alert_settings", {})
 
@@ -15,17 +20,29 @@ class AlertThresholds(NestedModel):
 class AutoUpdate(NestedModel):
     """Auto-update settings."""
     
+    DAYS = ("sun", "mon", "tue", "wed", "thu", "fri", "sat")
+    
+    __fields__ = ("hour", "days")
+    __slots__ = ("hour", "days_mask")
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.hour = data.get("hour", 0)
-        self.days = {
-            day: data.get(day, False) 
-            for day in ["sun", "mon", "tue", "wed", "thu", "fri", "sat"]
-        }
+        # Enabled days packed one bit per day, bit 0 = Sunday
+        self.days_mask = sum(1 << i for i, day in enumerate(self.DAYS) if data.get(day))
+    
+    @property
+    def days(self) -> Dict[str, bool]:
+        """Per-day enabled flags."""
+        mask = self.days_mask
+        return {day: bool(mask >> i & 1) for i, day in enumerate(self.DAYS)}
 
 
 class CacheReserved(NestedModel):
     """Cache reservation settings."""
     
+    __fields__ = ("reserved", "maxv", "minv")
+    __slots__ = __fields__
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.reserved = data.get("reserved", "unset")
         self.maxv = data.get("maxv", 90)
@@ -35,6 +52,9 @@ class CacheReserved(NestedModel):
 class NetworkSettings(NestedModel):
     """Network configuration settings."""
     
+    __fields__ = ("hostname", "default_gateway", "ip_addresses", "dns_servers", "search_domains")
+    __slots__ = __fields__
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.hostname = data.get("hostname", "")
         self.default_gateway = data.get("default_gateway", "")
@@ -46,33 +66,37 @@ class NetworkSettings(NestedModel):
 class CacheStatus(NestedModel):
     """Cache status information."""
     
+    __fields__ = ("size", "used", "dirty", "free", "percent_used")
+    __slots__ = __fields__ + ("size_gb", "used_gb")
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.size = data.get("size", 0)
         self.used = data.get("used", 0)
         self.dirty = data.get("dirty", 0)
         self.free = data.get("free", 0)
         self.percent_used = data.get("percent_used", 0.0)
-    
-    @property
-    def size_gb(self) -> float:
-        """Cache size in GB."""
-        return round(self.size / (1024**3), 2)
-    
-    @property
-    def used_gb(self) -> float:
-        """Cache used in GB."""
-        return round(self.used / (1024**3), 2)
+        self.size_gb = round(self.size / BYTES_PER_GB, 2)
+        self.used_gb = round(self.used / BYTES_PER_GB, 2)
 
 
 class Platform(NestedModel):
     """Platform information."""
     
+    __fields__ = ("platform_name", "cpu", "memory")
+    __nested_fields__ = ("cache_status",)
+    _keep_raw = True
+    __slots__ = __fields__ + ("_cache_status",)
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.platform_name = data.get("platform_name", "")
-        self.cache_status = CacheStatus(data.get("cache_status", {}))
         self.cpu = data.get("cpu", {})
         self.memory = data.get("memory", "0")
     
+    @cached_slot
+    def cache_status(self) -> CacheStatus:
+        """Cache status, parsed on first access."""
+        return CacheStatus(self._raw_data.get("cache_status", {}))
+    
     @property
     def cpu_cores(self) -> int:
         """Number of CPU cores."""
@@ -87,13 +111,22 @@ class Platform(NestedModel):
 class Status(NestedModel):
     """Filer status information."""
     
+    __fields__ = ("offline", "osversion", "updates", "uptime")
+    __nested_fields__ = ("platform",)
+    _keep_raw = True
+    __slots__ = __fields__ + ("_platform",)
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.offline = data.get("offline", False)
         self.osversion = data.get("osversion", "")
-        self.platform = Platform(data.get("platform", {}))
         self.updates = data.get("updates", {})
         self.uptime = data.get("uptime", 0)
     
+    @cached_slot
+    def platform(self) -> Platform:
+        """Platform information, parsed on first access."""
+        return Platform(self._raw_data.get("platform", {}))
+    
     @property
     def is_online(self) -> bool:
         """Whether the filer is online."""
@@ -113,18 +146,39 @@ class Status(NestedModel):
 class Settings(NestedModel):
     """Filer settings."""
     
+    __fields__ = ("cifs", "ftp", "qos", "remote_support", "snmp", "time")
+    __nested_fields__ = ("alert_thresholds", "autoupdate", "cache_reserved", "network_settings")
+    _keep_raw = True
+    __slots__ = __fields__ + ("_alert_thresholds", "_autoupdate", "_cache_reserved", "_network_settings")
+    
     def _parse_data(self, data: Dict[str, Any]):
-        self.alert_thresholds = AlertThresholds(data.get("alert_thresholds", {}))
-        self.autoupdate = AutoUpdate(data.get("autoupdate", {}))
-        self.cache_reserved = CacheReserved(data.get("cache_reserved", {}))
         self.cifs = data.get("cifs", {})
         self.ftp = data.get("ftp", {})
-        self.network_settings = NetworkSettings(data.get("network_settings", {}))
         self.qos = data.get("qos", {})
         self.remote_support = data.get("remote_support", {})
         self.snmp = data.get("snmp", {})
         self.time = data.get("time", {})
     
+    @cached_slot
+    def alert_thresholds(self) -> AlertThresholds:
+        """Alert thresholds, parsed on first access."""
+        return AlertThresholds(self._raw_data.get("alert_thresholds", {}))
+    
+    @cached_slot
+    def autoupdate(self) -> AutoUpdate:
+        """Auto-update settings, parsed on first access."""
+        return AutoUpdate(self._raw_data.get("autoupdate", {}))
+    
+    @cached_slot
+    def cache_reserved(self) -> CacheReserved:
+        """Cache reservation settings, parsed on first access."""
+        return CacheReserved(self._raw_data.get("cache_reserved", {}))
+    
+    @cached_slot
+    def network_settings(self) -> NetworkSettings:
+        """Network settings, parsed on first access."""
+        return NetworkSettings(self._raw_data.get("network_settings", {}))
+    
     @property
     def timezone(self) -> str:
         """System timezone."""
@@ -134,16 +188,29 @@ class Settings(NestedModel):
 class Filer(BaseModel):
     """Main filer model."""
     
+    __fields__ = ("build", "description", "guid", "management_state", "serial_number", "links")
+    __nested_fields__ = ("settings", "status")
+    _keep_raw = True
+    __slots__ = __fields__ + ("_settings", "_status")
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.build = data.get("build", "")
         self.description = data.get("description", "")
         self.guid = data.get("guid", "")
         self.management_state = data.get("management_state", "")
         self.serial_number = data.get("serial_number", "")
-        self.settings = Settings(data.get("settings", {}))
-        self.status = Status(data.get("status", {}))
         self.links = data.get("links", {})
     
+    @cached_slot
+    def settings(self) -> Settings:
+        """Filer settings, parsed on first access."""
+        return Settings(self._raw_data.get("settings", {}))
+    
+    @cached_slot
+    def status(self) -> Status:
+        """Filer status, parsed on first access."""
+        return Status(self._raw_data.get("status", {}))
+    
     def get_summary_dict(self) -> Dict[str, Any]:
         """Get a summary dictionary with key information."""
         return {
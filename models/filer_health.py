@@ -1,40 +1,108 @@
 #!/usr/bin/env python3
 """Filer health data models."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 from datetime import datetime
-from models.base import BaseModel
+from operator import attrgetter
+from models.base import BaseModel, cached_slot
+
+
+# Shared instances of the known status strings; equality checks against the
+# literals below then hit the identity fast path instead of comparing characters.
+_STATUSES = {status: status for status in ("", "Healthy", "Unhealthy", "No Results")}
+
+
+# Column index of each counted status in fleet_rollup() tallies
+_STATUS_COLUMNS = {"Healthy": 0, "Unhealthy": 1, "No Results": 2}
+
+
+def _canonical_status(value: Any) -> Any:
+    """Return the shared instance of a known status string."""
+    # Anything else passes through as-is; a dict or list can't be a lookup key
+    return _STATUSES.get(value, value) if isinstance(value, str) else value
+
+
+class ComponentGroups(NamedTuple):
+    """Component display names grouped by health status."""
+    healthy: Tuple[str, ...]
+    unhealthy: Tuple[str, ...]
+    no_results: Tuple[str, ...]
 
 
 class FilerHealth(BaseModel):
     """Filer health status model."""
     
+    __fields__ = (
+        "filer_serial_number", "last_updated", "network", "memory", "cpu", "disk",
+        "filesystem", "services", "nfs", "smb", "directoryservices", "cyberresilience",
+        "fileaccelerator", "agfl", "nasuni_iq", "links",
+    )
+    __slots__ = __fields__ + (
+        "_healthy", "_unhealthy", "_scored",
+        "_component_groups", "_overall_health_status", "_last_updated_datetime",
+    )
+    
+    # (display name, attribute) for every monitored component
+    _COMPONENTS = (
+        ("Network", "network"),
+        ("Memory", "memory"),
+        ("CPU", "cpu"),
+        ("Disk", "disk"),
+        ("Filesystem", "filesystem"),
+        ("Services", "services"),
+        ("NFS", "nfs"),
+        ("SMB", "smb"),
+        ("Directory Services", "directoryservices"),
+        ("Cyber Resilience", "cyberresilience"),
+        ("File Accelerator", "fileaccelerator"),
+        ("Advanced Global File Locking", "agfl"),
+        ("File IQ", "nasuni_iq"),
+    )
+    
+    # Component attribute names, in _COMPONENTS order
+    COMPONENT_FIELDS = tuple(attr for _, attr in _COMPONENTS)
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.filer_serial_number = data.get("filer_serial_number", "")
         self.last_updated = data.get("last_updated", "")
         
+        status = _canonical_status
+        
         # Core system health components
-        self.network = data.get("network", "")
-        self.memory = data.get("memory", "")
-        self.cpu = data.get("cpu", "")
-        self.disk = data.get("disk", "")
-        self.filesystem = data.get("filesystem", "")
-        self.services = data.get("services", "")
+        self.network = status(data.get("network", ""))
+        self.memory = status(data.get("memory", ""))
+        self.cpu = status(data.get("cpu", ""))
+        self.disk = status(data.get("disk", ""))
+        self.filesystem = status(data.get("filesystem", ""))
+        self.services = status(data.get("services", ""))
         
         # File services health
-        self.nfs = data.get("nfs", "")
-        self.smb = data.get("smb", "")
-        self.directoryservices = data.get("directoryservices", "")
+        self.nfs = status(data.get("nfs", ""))
+        self.smb = status(data.get("smb", ""))
+        self.directoryservices = status(data.get("directoryservices", ""))
         
         # Advanced features health
-        self.cyberresilience = data.get("cyberresilience", "")
-        self.fileaccelerator = data.get("fileaccelerator", "")
-        self.agfl = data.get("agfl", "")  # Advanced Global File Locking
-        self.nasuni_iq = data.get("nasuni_iq", "")  # File IQ
+        self.cyberresilience = status(data.get("cyberresilience", ""))
+        self.fileaccelerator = status(data.get("fileaccelerator", ""))
+        self.agfl = status(data.get("agfl", ""))  # Advanced Global File Locking
+        self.nasuni_iq = status(data.get("nasuni_iq", ""))  # File IQ
         
         self.links = data.get("links", {})
+        
+        # Tally component results once; records are not modified after parsing
+        healthy = unhealthy = scored = 0
+        for value in _component_statuses(self):
+            if value and value != "No Results":
+                scored += 1
+                if value == "Healthy":
+                    healthy += 1
+                elif value == "Unhealthy":
+                    unhealthy += 1
+        self._healthy = healthy
+        self._unhealthy = unhealthy
+        self._scored = scored
     
-    @property
+    @cached_slot
     def last_updated_datetime(self) -> Optional[datetime]:
         """Parse the last updated timestamp."""
         if not self.last_updated:
@@ -46,31 +114,33 @@ class FilerHealth(BaseModel):
         except (ValueError, AttributeError):
             return None
     
-    @property
+    @cached_slot
+    def component_groups(self) -> ComponentGroups:
+        """Classify all components in a single pass."""
+        healthy, unhealthy, no_results = [], [], []
+        for name, attr in self._COMPONENTS:
+            status = getattr(self, attr)
+            if status == "Healthy":
+                healthy.append(name)
+            elif status == "Unhealthy":
+                unhealthy.append(name)
+            elif status == "No Results":
+                no_results.append(name)
+        return ComponentGroups(tuple(healthy), tuple(unhealthy), tuple(no_results))
+    
+    @cached_slot
     def overall_health_status(self) -> str:
         """Determine overall health status based on all components."""
-        health_components = [
-            self.network, self.memory, self.cpu, self.disk, 
-            self.filesystem, self.services, self.nfs, self.smb,
-            self.directoryservices, self.cyberresilience, 
-            self.fileaccelerator, self.agfl, self.nasuni_iq
-        ]
-        
-        # Filter out empty and "No Results" statuses
-        active_components = [
-            comp for comp in health_components 
-            if comp and comp not in ["", "No Results"]
-        ]
-        
-        if not active_components:
+        # Empty and "No Results" statuses don't count
+        if not self._scored:
             return "Unknown"
         
         # If any component is unhealthy, overall status is unhealthy
-        if any(comp == "Unhealthy" for comp in active_components):
+        if self._unhealthy:
             return "Unhealthy"
         
         # If all active components are healthy, overall status is healthy
-        if all(comp == "Healthy" for comp in active_components):
+        if self._healthy == self._scored:
             return "Healthy"
         
         # Mixed or unknown states
@@ -94,115 +164,81 @@ class FilerHealth(BaseModel):
     @property
     def unhealthy_components(self) -> List[str]:
         """Get list of unhealthy components."""
-        components = {
-            "Network": self.network,
-            "Memory": self.memory,
-            "CPU": self.cpu,
-            "Disk": self.disk,
-            "Filesystem": self.filesystem,
-            "Services": self.services,
-            "NFS": self.nfs,
-            "SMB": self.smb,
-            "Directory Services": self.directoryservices,
-            "Cyber Resilience": self.cyberresilience,
-            "File Accelerator": self.fileaccelerator,
-            "Advanced Global File Locking": self.agfl,
-            "File IQ": self.nasuni_iq
-        }
-        
-        return [name for name, status in components.items() if status == "Unhealthy"]
+        return list(self.component_groups.unhealthy)
     
     @property
     def healthy_components(self) -> List[str]:
         """Get list of healthy components."""
-        components = {
-            "Network": self.network,
-            "Memory": self.memory,
-            "CPU": self.cpu,
-            "Disk": self.disk,
-            "Filesystem": self.filesystem,
-            "Services": self.services,
-            "NFS": self.nfs,
-            "SMB": self.smb,
-            "Directory Services": self.directoryservices,
-            "Cyber Resilience": self.cyberresilience,
-            "File Accelerator": self.fileaccelerator,
-            "Advanced Global File Locking": self.agfl,
-            "File IQ": self.nasuni_iq
-        }
-        
-        return [name for name, status in components.items() if status == "Healthy"]
+        return list(self.component_groups.healthy)
     
     @property
     def no_results_components(self) -> List[str]:
         """Get list of components with no monitoring results."""
-        components = {
-            "Network": self.network,
-            "Memory": self.memory,
-            "CPU": self.cpu,
-            "Disk": self.disk,
-            "Filesystem": self.filesystem,
-            "Services": self.services,
-            "NFS": self.nfs,
-            "SMB": self.smb,
-            "Directory Services": self.directoryservices,
-            "Cyber Resilience": self.cyberresilience,
-            "File Accelerator": self.fileaccelerator,
-            "Advanced Global File Locking": self.agfl,
-            "File IQ": self.nasuni_iq
-        }
-        
-        return [name for name, status in components.items() if status == "No Results"]
+        return list(self.component_groups.no_results)
     
     @property
     def health_score(self) -> float:
         """Calculate a health score (0-100) based on component status."""
-        components = [
-            self.network, self.memory, self.cpu, self.disk, 
-            self.filesystem, self.services, self.nfs, self.smb,
-            self.directoryservices, self.cyberresilience, 
-            self.fileaccelerator, self.agfl, self.nasuni_iq
-        ]
-        
         # Only count components that have actual results
-        scored_components = [
-            comp for comp in components 
-            if comp and comp not in ["", "No Results"]
-        ]
-        
-        if not scored_components:
+        if not self._scored:
             return 0.0
         
-        healthy_count = sum(1 for comp in scored_components if comp == "Healthy")
-        return round((healthy_count / len(scored_components)) * 100, 1)
+        return round((self._healthy / self._scored) * 100, 1)
+    
+    @classmethod
+    def fleet_rollup(cls, records: List["FilerHealth"]) -> Dict[str, Any]:
+        """Aggregate overall and per-component status counts in one pass."""
+        overall = {"Healthy": 0, "Unhealthy": 0, "Warning": 0, "Unknown": 0}
+        tallies = {attr: [0, 0, 0] for attr in cls.COMPONENT_FIELDS}
+        columns = [(attr, tallies[attr]) for attr in cls.COMPONENT_FIELDS]
+        column_of = _STATUS_COLUMNS.get
+        scores = []
+        
+        # Scores stay a per-record Python loop; 13 components per filer on fleets of a
+        # few hundred don't justify a NumPy/Numba dependency
+        for record in records:
+            overall[record.overall_health_status] += 1
+            score = record.health_score
+            if score > 0:
+                scores.append(score)
+            for attr, tally in columns:
+                status = getattr(record, attr)
+                column = column_of(status) if isinstance(status, str) else None
+                if column is not None:
+                    tally[column] += 1
+        
+        return {
+            "overall": overall,
+            "scores": scores,
+            "components": {
+                attr: {"healthy": h, "unhealthy": u, "no_results": n}
+                for attr, (h, u, n) in tallies.items()
+            },
+        }
     
     def get_summary_dict(self) -> Dict[str, Any]:
         """Get a summary dictionary with key information."""
-        return {
+        groups = self.component_groups
+        status = self.overall_health_status
+        summary = {
             "filer_serial_number": self.filer_serial_number,
             "last_updated": self.last_updated,
-            "overall_status": self.overall_health_status,
+            "overall_status": status,
             "health_score": self.health_score,
-            "is_healthy": self.is_healthy,
-            "is_unhealthy": self.is_unhealthy,
-            "has_warnings": self.has_warnings,
-            "unhealthy_components": self.unhealthy_components,
-            "healthy_components": self.healthy_components,
-            "no_results_components": self.no_results_components,
-            "total_components": len(self.healthy_components) + len(self.unhealthy_components),
-            
-            # Individual component statuses
-            "network": self.network,
-            "memory": self.memory,
-            "cpu": self.cpu,
-            "disk": self.disk,
-            "filesystem": self.filesystem,
-            "services": self.services,
-            "nfs": self.nfs,
-            "smb": self.smb,
-            "directoryservices": self.directoryservices,
-            "cyberresilience": self.cyberresilience,
-            "fileaccelerator": self.fileaccelerator,
-            "agfl": self.agfl,
-            "nasuni_iq": self.nasuni_iq
-        }
\ No newline at end of file
+            "is_healthy": status == "Healthy",
+            "is_unhealthy": status == "Unhealthy",
+            "has_warnings": status == "Warning",
+            "unhealthy_components": list(groups.unhealthy),
+            "healthy_components": list(groups.healthy),
+            "no_results_components": list(groups.no_results),
+            "total_components": len(groups.healthy) + len(groups.unhealthy),
+        }
+        
+        # Individual component statuses
+        for _, attr in self._COMPONENTS:
+            summary[attr] = getattr(self, attr)
+        return summary
+
+
+# Component statuses of a record, in COMPONENT_FIELDS order
+_component_statuses = attrgetter(*FilerHealth.COMPONENT_FIELDS)
@@ -1,18 +1,52 @@
 #!/usr/bin/env python3
 """Notification data model."""
 
+import re
 from typing import Dict, Any, Optional
 from datetime import datetime
-from models.base import BaseModel
+from models.base import BaseModel, cached_slot
+
+
+ERROR_PRIORITIES = frozenset(("error", "critical", "alert"))
+WARNING_PRIORITIES = frozenset(("warning", "warn"))
+INFO_PRIORITIES = frozenset(("info", "notice"))
+
+# Shared instances of the known priorities, so set lookups match by identity
+_PRIORITIES = {p: p for p in ERROR_PRIORITIES | WARNING_PRIORITIES | INFO_PRIORITIES}
+
+# Common patterns: "volume Volume1", "volume VolDemoOpsIQ"
+VOLUME_NAME_RE = re.compile(r'volume\s+([^:\s]+)', re.IGNORECASE)
+
+# Name keyword -> notification type, checked in order; first match wins
+TYPE_KEYWORDS = (
+    ("AV_", "Antivirus"),
+    ("ANTIVIRUS", "Antivirus"),
+    ("LICENSE", "License"),
+    ("SNAPSHOT", "Snapshot"),
+    ("REPLICATION", "Replication"),
+    ("CACHE", "Cache"),
+    ("QUOTA", "Quota"),
+    ("AUTH", "Authentication"),
+    ("LOGIN", "Authentication"),
+    ("NETWORK", "Network"),
+    ("CONNECTION", "Network"),
+)
 
 
 class Notification(BaseModel):
     """Notification model."""
     
+    __fields__ = (
+        "id", "date", "priority", "name", "message", "group", "acknowledged", "sticky",
+        "urgent", "origin", "links",
+    )
+    __slots__ = __fields__ + ("_datetime_obj",)
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.id = data.get("id", 0)
         self.date = data.get("date", "")
-        self.priority = data.get("priority", "")
+        priority = data.get("priority", "")
+        self.priority = _PRIORITIES.get(priority, priority) if isinstance(priority, str) else priority
         self.name = data.get("name", "")
         self.message = data.get("message", "")
         self.group = data.get("group", "")
@@ -22,30 +56,30 @@ class Notification(BaseModel):
         self.origin = data.get("origin", "")
         self.links = data.get("links", {})
     
-    @property
+    @cached_slot
     def datetime_obj(self) -> Optional[datetime]:
         """Get datetime object from date string."""
         try:
-            # Parse format like "2025-08-12T02:18:36UTC"
-            date_str = self.date.replace("UTC", "Z")
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except:
+            # Parse format like "2025-08-12T02:18:36UTC"; fromisoformat only accepts
+            # a "Z" suffix from Python 3.11, and the installer still allows 3.10
+            return datetime.fromisoformat(self.date.replace("UTC", "+00:00").replace("Z", "+00:00"))
+        except (ValueError, AttributeError):
             return None
     
     @property
     def is_error(self) -> bool:
         """Check if this is an error notification."""
-        return self.priority in ["error", "critical", "alert"]
+        return isinstance(self.priority, str) and self.priority in ERROR_PRIORITIES
     
     @property
     def is_warning(self) -> bool:
         """Check if this is a warning notification."""
-        return self.priority in ["warning", "warn"]
+        return isinstance(self.priority, str) and self.priority in WARNING_PRIORITIES
     
     @property
     def is_info(self) -> bool:
         """Check if this is an info notification."""
-        return self.priority in ["info", "notice"]
+        return isinstance(self.priority, str) and self.priority in INFO_PRIORITIES
     
     @property
     def filer_serial(self) -> Optional[str]:
@@ -60,37 +94,17 @@ class Notification(BaseModel):
     @property
     def volume_name(self) -> Optional[str]:
         """Extract volume name from message if present."""
-        # Common patterns: "volume Volume1", "volume VolDemoOpsIQ"
-        if "volume" in self.message.lower():
-            import re
-            # Look for "volume SomeName" pattern
-            match = re.search(r'volume\s+([^:\s]+)', self.message, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        return None
+        match = VOLUME_NAME_RE.search(self.message)
+        return match.group(1) if match else None
     
     @property
     def notification_type(self) -> str:
         """Get notification type category."""
         name_upper = self.name.upper()
-        if "AV_" in name_upper or "ANTIVIRUS" in name_upper:
-            return "Antivirus"
-        elif "LICENSE" in name_upper:
-            return "License"
-        elif "SNAPSHOT" in name_upper:
-            return "Snapshot"
-        elif "REPLICATION" in name_upper:
-            return "Replication"
-        elif "CACHE" in name_upper:
-            return "Cache"
-        elif "QUOTA" in name_upper:
-            return "Quota"
-        elif "AUTH" in name_upper or "LOGIN" in name_upper:
-            return "Authentication"
-        elif "NETWORK" in name_upper or "CONNECTION" in name_upper:
-            return "Network"
-        else:
-            return "General"
+        for keyword, notification_type in TYPE_KEYWORDS:
+            if keyword in name_upper:
+                return notification_type
+        return "General"
     
     def get_summary_dict(self) -> Dict[str, Any]:
         """Get a summary dictionary with key information."""
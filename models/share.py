@@ -2,41 +2,41 @@
 """Share-related data models."""
 
 from typing import Dict, Any, List
-from models.base import BaseModel, NestedModel
+from models.base import BaseModel
 
 
 class Share(BaseModel):
     """SMB/CIFS share model."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.guid = data.get("guid", "")
-        self.volume_guid = data.get("volume_guid", "")
-        self.filer_serial_number = data.get("filer_serial_number", "")
-        self.share_name = data.get("name", "")  # API uses "name", not "share_name"
-        self.path = data.get("path", "")
-        self.comment = data.get("comment", "")
-        self.readonly = data.get("readonly", False)
-        self.browseable = data.get("browseable", True)
-        
-        self.enable_mobile_access = data.get("mobile", False)  # API uses "mobile"
-        self.enable_browser_access = data.get("browser_access", False)  # API uses "browser_access"
-        self.enable_previous_vers = data.get("enable_previous_vers", False)  # This is correct
-        
-        self.browser_access_readonly = data.get("browser_access_readonly", False)
-        self.vetoed_files = data.get("veto_files", "")
-        self.links = data.get("links", {})
-        
-        self.enable_snapshots = data.get("enable_snapshots", False)
-        self.snapshot_policy = data.get("snapshot_policy", "")
-        self.audit_enabled = data.get("audit_enabled", False)
-        self.hidden = data.get("hidden", False)
-        self.case_sensitive = data.get("case_sensitive", False)
-        self.enable_snapshot_dirs = data.get("enable_snapshot_dirs", False)
-        self.hide_unreadable = data.get("hide_unreadable", False)
-        self.hosts_allow = data.get("hosts_allow", "")
-        self.aio_enabled = data.get("aio_enabled", True)
-        self.fruit_enabled = data.get("fruit_enabled", False)
-        self.smb_encrypt = data.get("smb_encrypt", "")
+    __parse_fields__ = (
+        ("guid", ""),
+        ("volume_guid", ""),
+        ("filer_serial_number", ""),
+        ("share_name", "", "name"),  # API uses "name", not "share_name"
+        ("path", ""),
+        ("comment", ""),
+        ("readonly", False),
+        ("browseable", True),
+        ("enable_mobile_access", False, "mobile"),  # API uses "mobile"
+        ("enable_browser_access", False, "browser_access"),  # API uses "browser_access"
+        ("enable_previous_vers", False),  # This is correct
+        ("browser_access_readonly", False),
+        ("vetoed_files", "", "veto_files"),
+        ("links", {}),
+        ("enable_snapshots", False),
+        ("snapshot_policy", ""),
+        ("audit_enabled", False),
+        ("hidden", False),
+        ("case_sensitive", False),
+        ("enable_snapshot_dirs", False),
+        ("hide_unreadable", False),
+        ("hosts_allow", ""),
+        ("aio_enabled", True),
+        ("fruit_enabled", False),
+        ("smb_encrypt", ""),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__
     
     @property
     def is_readonly(self) -> bool:
@@ -78,8 +78,6 @@ class Share(BaseModel):
             methods.append("Mobile")
         return methods
     
-
-    
     def get_summary_dict(self) -> Dict[str, Any]:
         """Get a summary dictionary with key information."""
         return {
@@ -1,32 +1,38 @@
 #!/usr/bin/env python3
 """Volume-related data models."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, NamedTuple, Tuple
 from models.base import BaseModel, NestedModel
 
 
 class Provider(NestedModel):
     """Cloud provider information."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.name = data.get("name", "")
-        self.shortname = data.get("shortname", "")
-        self.location = data.get("location", "")
-        self.storage_class = data.get("storage_class")
-        self.cred_uuid = data.get("cred_uuid", "")
+    __parse_fields__ = (
+        ("name", ""),
+        ("shortname", ""),
+        ("location", ""),
+        ("storage_class", None),
+        ("cred_uuid", ""),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__
 
 
 class AntivirusService(NestedModel):
     """Antivirus service configuration."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.enabled = data.get("enabled", False)
-        self.days = data.get("days", {})
-        self.check_files_immediately = data.get("check_files_immediately", False)
-        self.allday = data.get("allday", True)
-        self.start = data.get("start", 0)
-        self.stop = data.get("stop", 0)
-        self.frequency = data.get("frequency", 300)
+    __parse_fields__ = (
+        ("enabled", False),
+        ("days", {}),
+        ("check_files_immediately", False),
+        ("allday", True),
+        ("start", 0),
+        ("stop", 0),
+        ("frequency", 300),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__
     
     @property
     def active_days(self) -> List[str]:
@@ -37,9 +43,12 @@ class AntivirusService(NestedModel):
 class Protocols(NestedModel):
     """Protocol configuration."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.permissions_policy = data.get("permissions_policy", "")
-        self.protocols = data.get("protocols", [])
+    __parse_fields__ = (
+        ("permissions_policy", ""),
+        ("protocols", []),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__
     
     @property
     def protocol_list(self) -> str:
@@ -47,12 +56,15 @@ class Protocols(NestedModel):
         return ", ".join(self.protocols)
 
 
-class FilerAccess(NestedModel):
+class FilerAccess(NamedTuple):
     """Individual filer access permission."""
+    filer_guid: str
+    permission: str
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.filer_guid = data.get("filer_guid", "")
-        self.permission = data.get("permission", "")
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FilerAccess":
+        """Create a FilerAccess from an API filer_access entry."""
+        return cls(data.get("filer_guid", ""), data.get("permission", ""))
     
     @property
     def is_enabled(self) -> bool:
@@ -63,13 +75,23 @@ class FilerAccess(NestedModel):
 class RemoteAccess(NestedModel):
     """Remote access configuration."""
     
+    __slots__ = ("enabled", "access_permissions", "filer_access")
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.enabled = data.get("enabled", False)
         self.access_permissions = data.get("access_permissions", "")
         self.filer_access = [
-            FilerAccess(access) for access in data.get("filer_access", [])
+            FilerAccess.from_dict(access) for access in data.get("filer_access", [])
         ]
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert model to dictionary representation."""
+        return {
+            "enabled": self.enabled,
+            "access_permissions": self.access_permissions,
+            "filer_access": [access._asdict() for access in self.filer_access],
+        }
+    
     @property
     def enabled_filers(self) -> List[FilerAccess]:
         """Get list of filers with enabled access."""
@@ -84,13 +106,30 @@ class RemoteAccess(NestedModel):
     def readwrite_filers(self) -> List[FilerAccess]:
         """Get list of filers with readwrite access."""
         return [access for access in self.filer_access if access.permission == "readwrite"]
+    
+    @property
+    def access_counts(self) -> Tuple[int, int, int]:
+        """Count enabled, readonly and readwrite filers in one pass."""
+        enabled = readonly = readwrite = 0
+        for access in self.filer_access:
+            permission = access.permission
+            if permission != "disabled":
+                enabled += 1
+                if permission == "readonly":
+                    readonly += 1
+                elif permission == "readwrite":
+                    readwrite += 1
+        return enabled, readonly, readwrite
 
 
 class SnapshotRetention(NestedModel):
     """Snapshot retention policy."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.retain = data.get("retain", "")
+    __parse_fields__ = (
+        ("retain", ""),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__
     
     @property
     def is_infinite(self) -> bool:
@@ -101,18 +140,24 @@ class SnapshotRetention(NestedModel):
 class CloudIO(NestedModel):
     """Cloud I/O configuration."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.compression = data.get("compression", False)
-        self.chunk_size = data.get("chunk_size", 0)
+    __parse_fields__ = (
+        ("compression", False),
+        ("chunk_size", 0),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__
 
 
 class Auth(NestedModel):
     """Authentication configuration."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.authenticated_access = data.get("authenticated_access", True)
-        self.policy = data.get("policy", "")
-        self.policy_label = data.get("policy_label", "")
+    __parse_fields__ = (
+        ("authenticated_access", True),
+        ("policy", ""),
+        ("policy_label", ""),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__
     
     @property
     def is_public(self) -> bool:
@@ -123,6 +168,16 @@ class Auth(NestedModel):
 class Volume(BaseModel):
     """Main volume model."""
     
+    __fields__ = (
+        "guid", "filer_serial_number", "nmc_managed", "name", "quota", "case_sensitive",
+        "links",
+    )
+    __nested_fields__ = (
+        "provider", "antivirus_service", "protocols", "remote_access", "snapshot_retention",
+        "cloud_io", "auth",
+    )
+    __slots__ = __fields__ + __nested_fields__
+    
     def _parse_data(self, data: Dict[str, Any]):
         self.guid = data.get("guid", "")
         self.filer_serial_number = data.get("filer_serial_number", "")
@@ -167,24 +222,28 @@ class Volume(BaseModel):
     
     def get_summary_dict(self) -> Dict[str, Any]:
         """Get a summary dictionary with key information."""
+        provider = self.provider
+        remote_access = self.remote_access
+        auth = self.auth
+        enabled_filers, readonly_filers, readwrite_filers = remote_access.access_counts
         return {
             "guid": self.guid,
             "name": self.name,
             "filer_serial_number": self.filer_serial_number,
             "nmc_managed": self.nmc_managed,
-            "provider_name": self.provider.name,
-            "provider_location": self.provider.location,
+            "provider_name": provider.name,
+            "provider_location": provider.location,
             "protocols": self.protocols.protocol_list,
             "quota_gb": self.quota_gb,
             "has_quota": self.has_quota,
             "case_sensitive": self.case_sensitive,
-            "antivirus_enabled": self.antivirus_enabled,
-            "remote_access_enabled": self.remote_access.enabled,
+            "antivirus_enabled": self.antivirus_service.enabled,
+            "remote_access_enabled": remote_access.enabled,
             "compression_enabled": self.cloud_io.compression,
-            "authenticated_access": self.auth.authenticated_access if self.auth else True,
-            "is_public": self.auth.is_public if self.auth else False,
+            "authenticated_access": auth.authenticated_access if auth is not None else True,
+            "is_public": auth.is_public if auth is not None else False,
             "retention_infinite": self.snapshot_retention.is_infinite,
-            "enabled_filers_count": len(self.remote_access.enabled_filers),
-            "readonly_filers_count": len(self.remote_access.readonly_filers),
-            "readwrite_filers_count": len(self.remote_access.readwrite_filers),
-        }
\ No newline at end of file
+            "enabled_filers_count": enabled_filers,
+            "readonly_filers_count": readonly_filers,
+            "readwrite_filers_count": readwrite_filers,
+        }
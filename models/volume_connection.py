@@ -8,11 +8,14 @@ from models.base import BaseModel
 class VolumeConnection(BaseModel):
     """Volume-filer connection model."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.connected = data.get("connected", False)
-        self.volume_guid = data.get("volume_guid", "")
-        self.filer_serial_number = data.get("filer_serial_number", "")
-        self.links = data.get("links", {})
+    __parse_fields__ = (
+        ("connected", False),
+        ("volume_guid", ""),
+        ("filer_serial_number", ""),
+        ("links", {}),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__
     
     @property
     def is_connected(self) -> bool:
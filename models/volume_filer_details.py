@@ -1,34 +1,64 @@
 #!/usr/bin/env python3
 """Volume-Filer Details data models."""
 
-from typing import Dict, Any, List
+import sys
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 from datetime import datetime
-from models.base import BaseModel, NestedModel
+from models.base import BaseModel, NestedModel, cached_slot
+
+
+def _interned(value: Any) -> Any:
+    """Intern low-cardinality API strings so listings share one object per value."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Snapshot statuses reported while a snapshot is in progress
+ACTIVE_SNAPSHOT_STATUSES = frozenset(("running", "active", "in_progress"))
+
+
+BYTES_PER_GB = 1024 ** 3
+
+
+def _parse_snapshot_time(value: Any) -> Optional[datetime]:
+    """Parse an API snapshot timestamp like "2025-08-12T02:18:36UTC"."""
+    # Only strings reach the cache; other values can't be timestamps and may be unhashable
+    return _parse_snapshot_str(value) if isinstance(value, str) else None
+
+
+@lru_cache(maxsize=4096)
+def _parse_snapshot_str(value: str) -> Optional[datetime]:
+    # Memoized: the same timestamp strings recur across records in a listing
+    if not value:
+        return None  # never snapshotted
+    try:
+        return datetime.fromisoformat(value.replace("UTC", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
 
 
 class SyncSchedule(NestedModel):
     """Sync schedule configuration."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.days = data.get("days", {})
-        self.allday = data.get("allday", True)
-        self.start = data.get("start", 0)
-        self.stop = data.get("stop", 0)
-        self.frequency = data.get("frequency", 300)
-        self.auto_cache_allowed = data.get("auto_cache_allowed", True)
-        self.auto_cache_min_file_size = data.get("auto_cache_min_file_size", 0)
+    __parse_fields__ = (
+        ("days", {}),
+        ("allday", True),
+        ("start", 0),
+        ("stop", 0),
+        ("frequency", 300),
+        ("auto_cache_allowed", True),
+        ("auto_cache_min_file_size", 0),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__ + ("active_days", "frequency_minutes", "_schedule_summary")
     
-    @property
-    def active_days(self) -> List[str]:
-        """Get list of days when sync is active."""
-        return [day for day, active in self.days.items() if active]
-    
-    @property
-    def frequency_minutes(self) -> float:
-        """Get sync frequency in minutes."""
-        return self.frequency / 60 if self.frequency > 0 else 0
+    def _parse_data(self, data: Dict[str, Any]):
+        self._parse_fields(data)
+        # Days when the schedule runs
+        self.active_days = [day for day, active in self.days.items() if active]
+        self.frequency_minutes = self.frequency / 60 if self.frequency > 0 else 0
     
-    @property
+    @cached_slot
     def schedule_summary(self) -> str:
         """Get human-readable schedule summary."""
         if self.allday:
@@ -40,92 +70,123 @@ class SyncSchedule(NestedModel):
 class SnapshotSchedule(NestedModel):
     """Snapshot schedule configuration."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.days = data.get("days", {})
-        self.allday = data.get("allday", True)
-        self.start = data.get("start", 0)
-        self.stop = data.get("stop", 0)
-        self.frequency = data.get("frequency", 300)
+    __parse_fields__ = (
+        ("days", {}),
+        ("allday", True),
+        ("start", 0),
+        ("stop", 0),
+        ("frequency", 300),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__ + ("active_days", "frequency_minutes")
     
-    @property
-    def active_days(self) -> List[str]:
-        """Get list of days when snapshots are active."""
-        return [day for day, active in self.days.items() if active]
-    
-    @property
-    def frequency_minutes(self) -> float:
-        """Get snapshot frequency in minutes."""
-        return self.frequency / 60 if self.frequency > 0 else 0
+    def _parse_data(self, data: Dict[str, Any]):
+        self._parse_fields(data)
+        # Days when the schedule runs
+        self.active_days = [day for day, active in self.days.items() if active]
+        self.frequency_minutes = self.frequency / 60 if self.frequency > 0 else 0
     
     @property
     def is_enabled(self) -> bool:
         """Check if snapshot schedule is enabled."""
-        return any(self.days.values()) and self.frequency > 0
+        return bool(self.active_days) and self.frequency > 0
 
 
 class FileAlertsService(NestedModel):
     """File alerts service configuration."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.enabled = data.get("enabled", False)
+    __parse_fields__ = (
+        ("enabled", False),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__
 
 
 class AuditingLogs(NestedModel):
     """Auditing logs configuration."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.prune_audit_logs = data.get("prune_audit_logs", True)
-        self.days_to_keep = data.get("days_to_keep", 90)
-        self.exclude_by_default = data.get("exclude_by_default", False)
-        self.include_takes_priority = data.get("include_takes_priority", True)
-        self.include_patterns = data.get("include_patterns", [])
-        self.exclude_patterns = data.get("exclude_patterns", [])
-        self.user_blacklist = data.get("user_blacklist", [])
-        self.protocol_whitelist = data.get("protocol_whitelist", [])
+    __parse_fields__ = (
+        ("prune_audit_logs", True),
+        ("days_to_keep", 90),
+        ("exclude_by_default", False),
+        ("include_takes_priority", True),
+        ("include_patterns", []),
+        ("exclude_patterns", []),
+        ("user_blacklist", []),
+        ("protocol_whitelist", []),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__
+
+
+# Auditable event types; bit i of AuditingEvents.events_mask is _AUDIT_EVENTS[i]
+_AUDIT_EVENTS = ("create", "delete", "rename", "close", "security", "metadata", "write", "read")
+_ALL_AUDIT_EVENTS = (1 << len(_AUDIT_EVENTS)) - 1
+
+# Enabled event names for every possible mask value
+_AUDIT_EVENTS_BY_MASK = tuple(
+    tuple(event for i, event in enumerate(_AUDIT_EVENTS) if mask >> i & 1)
+    for mask in range(_ALL_AUDIT_EVENTS + 1)
+)
 
 
 class AuditingEvents(NestedModel):
     """Auditing events configuration."""
     
+    __parse_fields__ = tuple((event, True) for event in _AUDIT_EVENTS)
+    __fields__ = _AUDIT_EVENTS
+    __slots__ = __fields__ + ("events_mask",)
+    
     def _parse_data(self, data: Dict[str, Any]):
-        self.create = data.get("create", True)
-        self.delete = data.get("delete", True)
-        self.rename = data.get("rename", True)
-        self.close = data.get("close", True)
-        self.security = data.get("security", True)
-        self.metadata = data.get("metadata", True)
-        self.write = data.get("write", True)
-        self.read = data.get("read", True)
+        self._parse_fields(data)
+        # Enabled events packed one bit per event, in _AUDIT_EVENTS order
+        self.events_mask = sum(
+            1 << i for i, event in enumerate(_AUDIT_EVENTS) if getattr(self, event)
+        )
     
     @property
     def enabled_events(self) -> List[str]:
         """Get list of enabled event types."""
-        events = []
-        for event_type in ["create", "delete", "rename", "close", "security", "metadata", "write", "read"]:
-            if getattr(self, event_type, False):
-                events.append(event_type)
-        return events
+        return list(_AUDIT_EVENTS_BY_MASK[self.events_mask])
     
     @property
     def all_events_enabled(self) -> bool:
         """Check if all event types are enabled."""
-        return all([self.create, self.delete, self.rename, self.close, 
-                   self.security, self.metadata, self.write, self.read])
+        return self.events_mask == _ALL_AUDIT_EVENTS
 
 
 class Auditing(NestedModel):
     """Auditing configuration."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.enabled = data.get("enabled", False)
-        self.collapse = data.get("collapse", True)
-        self.events = AuditingEvents(data.get("events", {}))
-        self.logs = AuditingLogs(data.get("logs", {}))
-        self.syslog_export = data.get("syslog_export", False)
-        self.output_type = data.get("output_type", "csv")
-        self.destination = data.get("destination", "")
+    __parse_fields__ = (
+        ("enabled", False),
+        ("collapse", True),
+        ("syslog_export", False),
+        ("output_type", "csv"),
+        ("destination", ""),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __nested_fields__ = ("events", "logs")
+    _keep_raw = True
+    __slots__ = __fields__ + ("_events", "_logs", "_retention_summary")
     
-    @property
+    def _parse_data(self, data: Dict[str, Any]):
+        self._parse_fields(data)
+        self.output_type = _interned(self.output_type)
+    
+    # Sections are built per instance, never shared: a disabled configuration may
+    # still carry events and logs, and a shared default would leak attribute writes
+    @cached_slot
+    def events(self) -> AuditingEvents:
+        """Audited event types, parsed on first access."""
+        return AuditingEvents(self._raw_data.get("events", {}))
+    
+    @cached_slot
+    def logs(self) -> AuditingLogs:
+        """Audit log settings, parsed on first access."""
+        return AuditingLogs(self._raw_data.get("logs", {}))
+    
+    @cached_slot
     def retention_summary(self) -> str:
         """Get audit retention summary."""
         if self.logs.prune_audit_logs:
@@ -137,107 +198,131 @@ class Auditing(NestedModel):
 class VolumeFilerStatus(NestedModel):
     """Volume-filer connection status."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.accessible_data = data.get("accessible_data", 0)
-        self.data_not_yet_protected = data.get("data_not_yet_protected", 0)
-        self.first_snapshot = data.get("first_snapshot", "")
-        self.last_snapshot = data.get("last_snapshot", "")
-        self.last_snapshot_start = data.get("last_snapshot_start", "")
-        self.last_snapshot_end = data.get("last_snapshot_end", "")
-        self.last_snapshot_version = data.get("last_snapshot_version", 0)
-        self.snapshot_status = data.get("snapshot_status", "unknown")
-        self.snapshot_percent = data.get("snapshot_percent", 0)
-        self.ftp_dir_count = data.get("ftp_dir_count", 0)
-        self.export_count = data.get("export_count", 0)
-        self.share_count = data.get("share_count", 0)
-    
-    @property
-    def accessible_data_gb(self) -> float:
-        """Get accessible data in GB."""
-        return self.accessible_data / (1024**3) if self.accessible_data > 0 else 0
-    
-    @property
-    def data_not_yet_protected_gb(self) -> float:
-        """Get unprotected data in GB."""
-        return self.data_not_yet_protected / (1024**3) if self.data_not_yet_protected > 0 else 0
+    __parse_fields__ = (
+        ("accessible_data", 0),
+        ("data_not_yet_protected", 0),
+        ("first_snapshot", ""),
+        ("last_snapshot", ""),
+        ("last_snapshot_start", ""),
+        ("last_snapshot_end", ""),
+        ("last_snapshot_version", 0),
+        ("snapshot_status", "unknown"),
+        ("snapshot_percent", 0),
+        ("ftp_dir_count", 0),
+        ("export_count", 0),
+        ("share_count", 0),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __slots__ = __fields__ + (
+        "accessible_data_gb", "data_not_yet_protected_gb", "has_unprotected_data",
+        "total_services", "protection_percentage",
+        "_first_snapshot_datetime", "_last_snapshot_datetime",
+    )
     
-    @property
-    def has_unprotected_data(self) -> bool:
-        """Check if there's unprotected data."""
-        return self.data_not_yet_protected > 0
+    def _parse_data(self, data: Dict[str, Any]):
+        self._parse_fields(data)
+        self.snapshot_status = _interned(self.snapshot_status)
+        
+        # Derived values read by every summary, computed once here. The "> 0" guards
+        # stay so a negative API value reads as 0 rather than a negative size
+        accessible = self.accessible_data
+        unprotected = self.data_not_yet_protected
+        self.accessible_data_gb = accessible / BYTES_PER_GB if accessible > 0 else 0
+        self.data_not_yet_protected_gb = unprotected / BYTES_PER_GB if unprotected > 0 else 0
+        self.has_unprotected_data = unprotected > 0
+        self.total_services = self.share_count + self.export_count + self.ftp_dir_count
+        
+        # Percentage of data that is protected; fully protected needs no divide
+        if unprotected == 0:
+            self.protection_percentage = 100.0
+        else:
+            total_data = accessible + unprotected
+            self.protection_percentage = (accessible / total_data) * 100 if total_data else 100.0
     
-    @property
+    @cached_slot
     def first_snapshot_datetime(self) -> datetime:
         """Get first snapshot as datetime object."""
-        try:
-            return datetime.fromisoformat(self.first_snapshot.replace("UTC", "+00:00"))
-        except:
-            return None
+        return _parse_snapshot_time(self.first_snapshot)
     
-    @property
+    @cached_slot
     def last_snapshot_datetime(self) -> datetime:
         """Get last snapshot as datetime object."""
-        try:
-            return datetime.fromisoformat(self.last_snapshot.replace("UTC", "+00:00"))
-        except:
-            return None
+        return _parse_snapshot_time(self.last_snapshot)
     
     @property
     def is_snapshot_active(self) -> bool:
         """Check if snapshot is currently running."""
-        return self.snapshot_status in ["running", "active", "in_progress"]
+        status = self.snapshot_status
+        return isinstance(status, str) and status in ACTIVE_SNAPSHOT_STATUSES
     
     @property
     def is_snapshot_idle(self) -> bool:
         """Check if snapshot is idle."""
         return self.snapshot_status == "idle"
-    
-    @property
-    def total_services(self) -> int:
-        """Get total count of services (shares + exports + ftp)."""
-        return self.share_count + self.export_count + self.ftp_dir_count
-    
-    @property
-    def protection_percentage(self) -> float:
-        """Get percentage of data that is protected."""
-        total_data = self.accessible_data + self.data_not_yet_protected
-        if total_data == 0:
-            return 100.0
-        return (self.accessible_data / total_data) * 100
 
 
+# Built one record at a time with no batch constructor: the API client already
+# returns decoded dicts, so there are no raw bytes for a faster decoder to take over
 class VolumeFilerDetails(BaseModel):
     """Volume-Filer connection details model."""
     
-    def _parse_data(self, data: Dict[str, Any]):
-        self.guid = data.get("guid", "")
-        self.filer_serial_number = data.get("filer_serial_number", "")
-        self.name = data.get("name", "")
-        self.type = data.get("type", "")
-        self.sync_schedule = SyncSchedule(data.get("sync_schedule", {}))
-        self.snapshot_schedule = SnapshotSchedule(data.get("snapshot_schedule", {}))
-        self.snapshot_access = data.get("snapshot_access", False)
-        self.file_alerts_service = FileAlertsService(data.get("file_alerts_service", {}))
-        self.auditing = Auditing(data.get("auditing", {}))
-        self.status = VolumeFilerStatus(data.get("status", {}))
-        self.links = data.get("links", {})
+    __parse_fields__ = (
+        ("guid", ""),
+        ("filer_serial_number", ""),
+        ("name", ""),
+        ("type", ""),
+        ("snapshot_access", False),
+        ("links", {}),
+    )
+    __fields__ = tuple(spec[0] for spec in __parse_fields__)
+    __nested_fields__ = (
+        "sync_schedule", "snapshot_schedule", "file_alerts_service", "auditing", "status",
+    )
+    _keep_raw = True
+    __slots__ = __fields__ + (
+        "is_master", "is_cache",
+        "_sync_schedule", "_snapshot_schedule", "_file_alerts_service", "_auditing", "_status",
+        "_volume_guid", "_service_summary",
+    )
     
-    @property
+    def _parse_data(self, data: Dict[str, Any]):
+        self._parse_fields(data)
+        self.type = _interned(self.type)
+        volume_type = self.type.lower()
+        self.is_master = volume_type == "master"
+        self.is_cache = volume_type == "cache"
+    
+    @cached_slot
+    def sync_schedule(self) -> SyncSchedule:
+        """Sync schedule, parsed on first access."""
+        return SyncSchedule(self._raw_data.get("sync_schedule", {}))
+    
+    @cached_slot
+    def snapshot_schedule(self) -> SnapshotSchedule:
+        """Snapshot schedule, parsed on first access."""
+        return SnapshotSchedule(self._raw_data.get("snapshot_schedule", {}))
+    
+    @cached_slot
+    def file_alerts_service(self) -> FileAlertsService:
+        """File alerts service settings, parsed on first access."""
+        return FileAlertsService(self._raw_data.get("file_alerts_service", {}))
+    
+    @cached_slot
+    def auditing(self) -> Auditing:
+        """Auditing settings, parsed on first access."""
+        return Auditing(self._raw_data.get("auditing", {}))
+    
+    @cached_slot
+    def status(self) -> VolumeFilerStatus:
+        """Connection status, parsed on first access."""
+        return VolumeFilerStatus(self._raw_data.get("status", {}))
+    
+    @cached_slot
     def volume_guid(self) -> str:
         """Extract volume GUID from full GUID."""
         # The guid appears to be in format "volume_guid_number"
-        parts = self.guid.split("_")
-        return "_".join(parts[:-1]) if len(parts) > 1 else self.guid
-    
-    @property
-    def is_master(self) -> bool:
-        """Check if this is a master volume."""
-        return self.type.lower() == "master"
-    
-    @property
-    def is_cache(self) -> bool:
-        """Check if this is a cache volume."""
-        return self.type.lower() == "cache"
+        volume_guid, separator, _ = self.guid.rpartition("_")
+        return volume_guid if separator else self.guid
     
     @property
     def has_snapshot_schedule(self) -> bool:
@@ -252,36 +337,44 @@ class VolumeFilerDetails(BaseModel):
     @property
     def data_protection_status(self) -> str:
         """Get overall data protection status."""
-        if self.status.has_unprotected_data:
-            return f"At Risk ({self.status.protection_percentage:.1f}% protected)"
+        status = self.status
+        if status.has_unprotected_data:
+            return f"At Risk ({status.protection_percentage:.1f}% protected)"
         else:
             return "Fully Protected"
     
-    @property
+    @cached_slot
     def service_summary(self) -> str:
         """Get summary of services configured."""
+        status = self.status
         services = []
-        if self.status.share_count > 0:
-            services.append(f"{self.status.share_count} shares")
-        if self.status.export_count > 0:
-            services.append(f"{self.status.export_count} exports")
-        if self.status.ftp_dir_count > 0:
-            services.append(f"{self.status.ftp_dir_count} FTP dirs")
+        if status.share_count > 0:
+            services.append(f"{status.share_count} shares")
+        if status.export_count > 0:
+            services.append(f"{status.export_count} exports")
+        if status.ftp_dir_count > 0:
+            services.append(f"{status.ftp_dir_count} FTP dirs")
         
         return ", ".join(services) if services else "No services"
     
     @property
     def security_features_summary(self) -> Dict[str, bool]:
         """Get summary of enabled security features."""
+        auditing = self.auditing
         return {
-            "auditing": self.auditing.enabled,
+            "auditing": auditing.enabled,
             "file_alerts": self.file_alerts_service.enabled,
             "snapshot_access": self.snapshot_access,
-            "syslog_export": self.auditing.syslog_export if self.auditing.enabled else False
+            "syslog_export": auditing.syslog_export if auditing.enabled else False
         }
     
     def get_summary_dict(self) -> Dict[str, Any]:
         """Get a summary dictionary with key information."""
+        # Built fresh per call: callers may edit the result, and a memoized copy
+        # would still share the nested security_features dict between them
+        status = self.status
+        auditing = self.auditing
+        auditing_enabled = auditing.enabled
         return {
             "guid": self.guid,
             "volume_guid": self.volume_guid,
@@ -289,22 +382,22 @@ class VolumeFilerDetails(BaseModel):
             "filer_serial_number": self.filer_serial_number,
             "type": self.type,
             "is_master": self.is_master,
-            "accessible_data_gb": self.status.accessible_data_gb,
-            "unprotected_data_gb": self.status.data_not_yet_protected_gb,
-            "protection_percentage": self.status.protection_percentage,
+            "accessible_data_gb": status.accessible_data_gb,
+            "unprotected_data_gb": status.data_not_yet_protected_gb,
+            "protection_percentage": status.protection_percentage,
             "data_protection_status": self.data_protection_status,
             "snapshot_enabled": self.has_snapshot_schedule,
-            "snapshot_status": self.status.snapshot_status,
-            "last_snapshot": self.status.last_snapshot,
-            "auditing_enabled": self.auditing.enabled,
+            "snapshot_status": status.snapshot_status,
+            "last_snapshot": status.last_snapshot,
+            "auditing_enabled": auditing_enabled,
             "file_alerts_enabled": self.file_alerts_service.enabled,
             "snapshot_access_enabled": self.snapshot_access,
             "service_summary": self.service_summary,
-            "total_services": self.status.total_services,
-            "share_count": self.status.share_count,
-            "export_count": self.status.export_count,
-            "ftp_dir_count": self.status.ftp_dir_count,
+            "total_services": status.total_services,
+            "share_count": status.share_count,
+            "export_count": status.export_count,
+            "ftp_dir_count": status.ftp_dir_count,
             "sync_schedule_summary": self.sync_schedule.schedule_summary,
-            "auditing_retention": self.auditing.retention_summary if self.auditing.enabled else "N/A",
+            "auditing_retention": auditing.retention_summary if auditing_enabled else "N/A",
             "security_features": self.security_features_summary
-        }
\ No newline at end of file
+        }
@@ -10,6 +10,15 @@ from api.filers_api import FilersAPIClient
 from config.settings import config
 from api.filer_health_api import FilerHealthAPIClient
 from api.auth_api import AuthAPIClient
+from config.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+def _print_exc():
+    """Print the exception being handled to stderr."""
+    import traceback
+    traceback.print_exc(file=sys.stderr)
 
 
 class MCPServer:
@@ -24,6 +33,9 @@ class MCPServer:
     
     def _setup_tools(self):
         """Setup and register all tools with improved error handling."""
+        # Registration is deliberately eager. Clients call tools/list right after
+        # initialize and need every tool's full inputSchema, so deferring a category
+        # to first use would only move its import cost into that first request.
         print("\n🚀 Setting up MCP Server tools...", file=sys.stderr)
         print("=" * 60, file=sys.stderr)
         
@@ -35,7 +47,7 @@ class MCPServer:
         shares_client = None
         try:
             from api.shares_api import SharesAPIClient
-            if hasattr(config, 'shares_config'):
+            if "shares" in config.available_services:
                 shares_client = SharesAPIClient(config.shares_config)
             else:
                 shares_client = SharesAPIClient(config.filers_config)  # Fallback to filers config
@@ -47,7 +59,7 @@ class MCPServer:
         volumes_client = None
         try:
             from api.volumes_api import VolumesAPIClient
-            if hasattr(config, 'volumes_config'):
+            if "volumes" in config.available_services:
                 volumes_client = VolumesAPIClient(config.volumes_config)
             else:
                 volumes_client = VolumesAPIClient(config.filers_config)  # Fallback to filers config
@@ -98,8 +110,7 @@ class MCPServer:
                 
         except (ImportError, AttributeError) as e:
             print(f"⚠️ Volume-Filer Details tools not available: {e}", file=sys.stderr)
-            import traceback
-            traceback.print_exc(file=sys.stderr)
+            _print_exc()
         
         print("=" * 60, file=sys.stderr)
     
@@ -114,8 +125,9 @@ class MCPServer:
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Handle tool calls with improved error handling."""
-            print(f"\n🔧 Calling tool: {name}", file=sys.stderr)
-            print(f"   Arguments: {arguments}", file=sys.stderr)
+            # Arguments only at DEBUG; RedactSecrets truncates any record mentioning a token
+            logger.info("Calling tool %s", name)
+            logger.debug("Tool %s arguments: %r", name, arguments)
             
             try:
                 result = await self.tool_registry.execute_tool(name, arguments)
@@ -124,18 +136,16 @@ class MCPServer:
                 if result and len(result) > 0:
                     text_length = len(result[0].text) if hasattr(result[0], 'text') else 0
                     if "❌ Error:" in result[0].text:
-                        print(f"   Result: ❌ Error in response", file=sys.stderr)
+                        logger.warning("Tool %s: ❌ Error in response", name)
                     else:
-                        print(f"   Result: ✅ Success ({text_length} chars)", file=sys.stderr)
+                        logger.info("Tool %s: ✅ Success (%d chars)", name, text_length)
                 else:
-                    print(f"   Result: ⚠️ Empty response", file=sys.stderr)
+                    logger.warning("Tool %s: ⚠️ Empty response", name)
                 
                 return result
                 
             except Exception as e:
-                print(f"   Result: ❌ Exception: {e}", file=sys.stderr)
-                import traceback
-                traceback.print_exc(file=sys.stderr)
+                logger.exception("Tool %s: ❌ Exception: %s", name, e)
                 return [TextContent(
                     type="text",
                     text=f"❌ Error executing tool '{name}': {str(e)}"
@@ -145,31 +155,36 @@ class MCPServer:
         """Print a summary of registered tools."""
         stats = self.tool_registry.get_tool_stats()
         
-        print("\n📊 Tool Registration Summary", file=sys.stderr)
-        print("=" * 60, file=sys.stderr)
-        print(f"Total Tools Registered: {stats['total_tools']}", file=sys.stderr)
+        lines = [
+            "\n📊 Tool Registration Summary",
+            "=" * 60,
+            f"Total Tools Registered: {stats['total_tools']}",
+        ]
         
         if stats.get('categories'):
-            print("\nTools by Category:", file=sys.stderr)
+            lines.append("\nTools by Category:")
             for category, info in stats['categories'].items():
-                print(f"\n  {category.upper()} ({info['count']} tools):", file=sys.stderr)
-                for tool in info['tools']:
-                    print(f"    • {tool}", file=sys.stderr)
+                lines.append(f"\n  {category.upper()} ({info['count']} tools):")
+                lines.extend(f"    • {tool}" for tool in info['tools'])
         
         # Special note about volume-filer consolidation
         if 'volume_filer' in stats.get('categories', {}):
             vf_tools = stats['categories']['volume_filer']['tools']
             if 'analyze_volume_operations' in vf_tools:
-                print("\n📌 Note: Volume-Filer Analysis Consolidation", file=sys.stderr)
-                print("  The 'analyze_volume_operations' tool consolidates:", file=sys.stderr)
-                print("    • Snapshot analysis (focus='snapshots')", file=sys.stderr)
-                print("    • Sync analysis (focus='sync')", file=sys.stderr)
-                print("    • Auditing analysis (focus='auditing')", file=sys.stderr)
-                print("    • Data protection analysis (focus='data_protection')", file=sys.stderr)
-                print("    • Comprehensive analysis (no focus parameter)", file=sys.stderr)
+                lines += [
+                    "\n📌 Note: Volume-Filer Analysis Consolidation",
+                    "  The 'analyze_volume_operations' tool consolidates:",
+                    "    • Snapshot analysis (focus='snapshots')",
+                    "    • Sync analysis (focus='sync')",
+                    "    • Auditing analysis (focus='auditing')",
+                    "    • Data protection analysis (focus='data_protection')",
+                    "    • Comprehensive analysis (no focus parameter)",
+                ]
         
-        print("\n" + "=" * 60, file=sys.stderr)
-        print("✅ MCP Server ready!", file=sys.stderr)
+        lines += ["\n" + "=" * 60, "✅ MCP Server ready!"]
+        # One write for the whole block. It stays off the logger, whose secret
+        # filter would truncate any message that names a token tool.
+        sys.stderr.write("\n".join(lines) + "\n")
     
     def add_api_tools(self, api_name: str, client_class, config_attr: str):
         """Add tools for a new API dynamically."""
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Base tool class for MCP tools."""
 
+import functools
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List
 from mcp.types import Tool, TextContent
@@ -9,9 +10,18 @@ from mcp.types import Tool, TextContent
 class BaseTool(ABC):
     """Base class for MCP tools."""
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Schemas are static per tool class, so build each one only once
+        if "get_schema" in cls.__dict__:
+            cls.get_schema = _cache_schema(cls.__dict__["get_schema"])
+    
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
+        # Required fields that are also declared properties, checked on every call
+        schema = self.get_schema()
+        self._required = frozenset(schema.get("required", ())).intersection(schema.get("properties", {}))
     
     @abstractmethod
     def get_schema(self) -> Dict[str, Any]:
@@ -24,19 +34,21 @@ class BaseTool(ABC):
         pass
     
     def to_mcp_tool(self) -> Tool:
-        """Convert this tool to an MCP Tool object."""
-        return Tool(
-            name=self.name,
-            description=self.description,
-            inputSchema=self.get_schema()
-        )
+        """Convert this tool to an MCP Tool object (built on first use, then reused)."""
+        try:
+            return self._mcp_tool
+        except AttributeError:
+            self._mcp_tool = Tool(
+                name=self.name,
+                description=self.description,
+                inputSchema=self.get_schema()
+            )
+            return self._mcp_tool
     
     def validate_arguments(self, arguments: Dict[str, Any]) -> bool:
         """Validate the provided arguments against the schema."""
         # Basic validation - can be extended with jsonschema library
-        schema = self.get_schema()
-        required_fields = schema.get("properties", {}).keys()
-        return all(field in arguments for field in required_fields if field in schema.get("required", []))
+        return self._required.issubset(arguments)
     
     def format_error(self, error: str) -> List[TextContent]:
         """Format an error message as TextContent."""
@@ -50,4 +62,18 @@ class BaseTool(ABC):
         return [TextContent(
             type="text",
             text=f"✅ {message}"
-        )]
\ No newline at end of file
+        )]
+
+
+def _cache_schema(get_schema):
+    """Wrap a get_schema() implementation so it runs once per class."""
+    schema = None
+    
+    @functools.wraps(get_schema)
+    def cached_get_schema(self) -> Dict[str, Any]:
+        nonlocal schema
+        if schema is None:
+            schema = get_schema(self)
+        return schema
+    
+    return cached_get_schema
@@ -48,6 +48,8 @@ class ListFilersTool(BaseTool):
             raw_response = await self.api_client.list_filers()
             if "error" not in raw_response:
                 output += "\n\n=== RAW API DATA (for complex queries) ===\n"
+                # stdlib json on purpose: orjson isn't a dependency, and its output
+                # differs (non-ASCII left unescaped, datetimes accepted)
                 output += json.dumps(raw_response, indent=2)
             
             return [TextContent(type="text", text=output)]
@@ -172,14 +172,7 @@ class ToolRegistry:
     
     def get_tool_list(self) -> List[Tool]:
         """Get list of all registered tools for MCP."""
-        tools = []
-        for name, tool in self.tools.items():
-            tools.append(Tool(
-                name=name,
-                description=tool.description,
-                inputSchema=tool.get_schema()
-            ))
-        return tools
+        return [tool.to_mcp_tool() for tool in self.tools.values()]
     
     def get_tool_names(self) -> List[str]:
         """Get list of all registered tool names."""